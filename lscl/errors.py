@@ -30,6 +30,9 @@
 
 from __future__ import annotations
 
+from functools import partial
+from typing import Any
+
 
 class Error(ValueError):
     """An error has occurred in an lscl function."""
@@ -63,15 +66,33 @@ class DecodeError(Error):
         column: int,
         offset: int,
     ) -> None:
-        message = message or "A decoding error has occurred"
-        super().__init__(
-            f"At line {line}, column {column}: "
-            + f"{message[0].lower()}{message[1:]}",
-        )
+        super().__init__(message)
         self.line = line
         self.column = column
         self.offset = offset
 
+    def __reduce__(self, /) -> tuple[Any, ...]:
+        # NOTE: The position is passed as keyword-only arguments, which
+        #       the default reduction does not support.
+        return (
+            partial(
+                type(self),
+                line=self.line,
+                column=self.column,
+                offset=self.offset,
+            ),
+            self.args,
+        )
+
+    def __str__(self, /) -> str:
+        # NOTE: The message is only formatted here, so that decoding errors
+        #       that are caught and never displayed do not pay for it.
+        message = self.args[0] or "A decoding error has occurred"
+        return (
+            f"At line {self.line}, column {self.column}: "
+            + f"{message[0].lower()}{message[1:]}"
+        )
+
 
 class StringRenderingError(Error):
     """An error has occurred while rendering a string."""
@@ -82,11 +103,15 @@ class StringRenderingError(Error):
     """String that could not be rendered."""
 
     def __init__(self, /, *, string: str) -> None:
-        super().__init__(
-            f"The following string could not be rendered: {string!r}",
-        )
+        super().__init__(string)
         self.string = string
 
+    def __reduce__(self, /) -> tuple[Any, ...]:
+        return (partial(type(self), string=self.string), ())
+
+    def __str__(self, /) -> str:
+        return f"The following string could not be rendered: {self.string!r}"
+
 
 class SelectorElementRenderingError(Error):
     """An error has occurred while rendering a selector element."""
@@ -97,8 +122,17 @@ class SelectorElementRenderingError(Error):
     """Selector element that could not be rendered."""
 
     def __init__(self, /, *, selector_element: str) -> None:
-        super().__init__(
+        super().__init__(selector_element)
+        self.selector_element = selector_element
+
+    def __reduce__(self, /) -> tuple[Any, ...]:
+        return (
+            partial(type(self), selector_element=self.selector_element),
+            (),
+        )
+
+    def __str__(self, /) -> str:
+        return (
             "The following selector could not be rendered: "
-            + f"{selector_element!r}",
+            + f"{self.selector_element!r}"
         )
-        self.selector_element = selector_element
@@ -30,10 +30,12 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal, Union
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Annotated, Any, Literal, Union
 
 from annotated_types import Len
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing_extensions import TypeAliasType
 
 from .lang import (
@@ -46,6 +48,7 @@ from .lang import (
 )
 from .parser import parse_lscl
 from .renderer import render_as_lscl
+from .utils import _lookup_by_type
 
 
 LogstashFilters = TypeAliasType(
@@ -58,6 +61,8 @@ LogstashFilters = TypeAliasType(
 class LogstashFilter(BaseModel):
     """Definition of a Logstash filter."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     """Name of the filter."""
 
@@ -68,6 +73,8 @@ class LogstashFilter(BaseModel):
 class LogstashFilterBranching(BaseModel):
     """Condition under which one or more filters can be executed."""
 
+    model_config = ConfigDict(defer_build=True)
+
     conditions: Annotated[
         list[tuple[LsclCondition, LogstashFilters]],
         Len(min_length=1),
@@ -78,74 +85,195 @@ class LogstashFilterBranching(BaseModel):
     """Default branch to take, if other branches aren't explored."""
 
 
+def _walk_conditions(
+    element: LsclConditions | LogstashFilterBranching,
+    dest: list,
+    stack: list,
+    /,
+) -> None:
+    """Add LSCL conditions with empty bodies, and schedule their walk.
+
+    This is used by walkers producing :py:class:`LsclConditions` from either
+    LSCL conditions or Logstash filter branching, since both have the same
+    structure. Bodies are created empty here, and populated in place once
+    popped from the stack.
+
+    :param element: Conditions or branching to walk.
+    :param dest: List to add the resulting conditions to.
+    :param stack: Stack to schedule the bodies' walk on.
+    """
+    conditions: list[tuple[LsclCondition, LsclContent]] = []
+    add_condition = conditions.append
+    schedule = stack.append
+    for cond, body in element.conditions:
+        content: LsclContent = []
+        add_condition((cond, content))
+        schedule((content, body))
+
+    default: LsclContent | None = None
+    if element.default is not None:
+        default = []
+        schedule((default, element.default))
+
+    # NOTE: Conditions have already been validated, so we can construct
+    #       the resulting model without validating them again.
+    dest.append(
+        LsclConditions.model_construct(conditions=conditions, default=default),
+    )
+
+
+def _get_filters_from_conditions(
+    element: LsclConditions,
+    dest: LogstashFilters,
+    stack: list[tuple[LogstashFilters, LsclContent]],
+    /,
+) -> None:
+    """Add branching for LSCL conditions, and schedule their walk.
+
+    :param element: Conditions to get the branching from.
+    :param dest: List to add the resulting branching to.
+    :param stack: Stack to schedule the bodies' walk on.
+    """
+    conditions: list[tuple[LsclCondition, LogstashFilters]] = []
+    add_condition = conditions.append
+    schedule = stack.append
+    for cond, body in element.conditions:
+        filters: LogstashFilters = []
+        add_condition((cond, filters))
+        schedule((filters, body))
+
+    default: LogstashFilters | None = None
+    if element.default:
+        default = []
+        schedule((default, element.default))
+
+    dest.append(
+        LogstashFilterBranching.model_construct(
+            conditions=conditions,
+            default=default,
+        ),
+    )
+
+
+def _get_filters_from_block(
+    element: LsclBlock,
+    dest: LogstashFilters,
+    stack: list[tuple[LogstashFilters, LsclContent]],
+    /,
+) -> None:
+    """Add a filter for an LSCL block.
+
+    :param element: Block to get the filter from.
+    :param dest: List to add the resulting filter to.
+    :param stack: Stack to schedule walks on, unused here.
+    """
+    # We want to get the configuration from the attributes.
+    config: dict[str, LsclData] = {}
+    for subelement in element.content:
+        if isinstance(subelement, LsclAttribute):
+            config[subelement.name] = subelement.content
+
+    dest.append(
+        LogstashFilter.model_construct(name=element.name, config=config),
+    )
+
+
+_GET_FILTERS_HANDLERS: dict[type, Callable[[Any, Any, Any], None]] = {
+    LsclConditions: _get_filters_from_conditions,
+    LsclBlock: _get_filters_from_block,
+}
+"""Handlers for :py:func:`_get_filters`, by exact element type.
+
+Conditions in the source determine branching, and blocks are considered
+to be filter configurations. Subclasses of these are handled as their
+base type, and other elements are ignored.
+"""
+
+
 def _get_filters(
     raw: LsclContent,
     /,
 ) -> LogstashFilters:
     """Get filters defined in a given content.
 
+    Nested condition bodies are walked using an explicit stack rather than
+    recursion, so that deeply nested configurations do not hit the
+    interpreter's recursion limit.
+
     :param raw: Raw LSCL content to get the filters from.
     :return: Logstash filters or branching.
     """
     result: list[LogstashFilter | LogstashFilterBranching] = []
+    stack: list[tuple[LogstashFilters, LsclContent]] = [(result, raw)]
 
-    for element in raw:
-        if isinstance(element, LsclConditions):
-            # We have a condition in the source, we want to determine
-            # branching out of it.
-            result.append(
-                LogstashFilterBranching(
-                    conditions=[
-                        (cond, _get_filters(body))
-                        for cond, body in element.conditions
-                    ],
-                    default=(
-                        _get_filters(element.default)
-                        if element.default
-                        else None
-                    ),
-                ),
-            )
-        elif isinstance(element, LsclBlock):
-            # We consider this to be a filter configuration.
-            # We want to get the configuration from the attributes.
-            config: dict[str, LsclData] = {}
-            for subelement in element.content:
-                if isinstance(subelement, LsclAttribute):
-                    config[subelement.name] = subelement.content
-
-            result.append(LogstashFilter(name=element.name, config=config))
+    while stack:
+        dest, items = stack.pop()
+
+        for element in items:
+            handler = _lookup_by_type(_GET_FILTERS_HANDLERS, element)
+            if handler is not None:
+                handler(element, dest, stack)
 
     return result
 
 
-def _find_filter_content(raw: LsclContent, /) -> LsclContent:
-    """Find filter content recursively.
+def _find_filter_content_in_block(
+    element: LsclBlock,
+    dest: LsclContent,
+    stack: list[tuple[LsclContent, LsclContent]],
+    /,
+) -> bool:
+    """Add the content of a block, if it is a "filter" block.
+
+    :param element: Block to get the content from.
+    :param dest: List to add the content to.
+    :param stack: Stack to schedule walks on, unused here.
+    :return: Whether the block was a "filter" block.
+    """
+    if element.name != "filter":
+        return False
+
+    dest += element.content
+    return True
+
+
+_FIND_FILTER_CONTENT_HANDLERS: dict[
+    type,
+    Callable[[Any, Any, Any], bool | None],
+] = {
+    LsclBlock: _find_filter_content_in_block,
+    LsclConditions: _walk_conditions,
+}
+"""Handlers for :py:func:`_find_filter_content`, by exact element type.
+
+Subclasses of these types are handled as their base type. Handlers
+return a truthy value if a "filter" block has been found.
+"""
+
+
+def _find_filter_content(raw: LsclContent, /) -> tuple[LsclContent, bool]:
+    """Find filter content.
+
+    Nested condition bodies are walked using an explicit stack rather than
+    recursion.
 
     :param raw: Raw content in which to find content.
-    :return: Filter content.
+    :return: Filter content, and whether at least one "filter" block has
+        been found, even if empty.
     """
-    content = []
-    for element in raw:
-        if isinstance(element, LsclBlock):
-            if element.name == "filter":
-                content.extend(element.content)
-        elif isinstance(element, LsclConditions):
-            content.append(
-                LsclConditions(
-                    conditions=[
-                        (cond, _find_filter_content(body))
-                        for cond, body in element.conditions
-                    ],
-                    default=(
-                        _find_filter_content(element.default)
-                        if element.default is not None
-                        else None
-                    ),
-                ),
-            )
+    content: LsclContent = []
+    stack: list[tuple[LsclContent, LsclContent]] = [(content, raw)]
+    found = False
 
-    return content
+    while stack:
+        dest, items = stack.pop()
+
+        for element in items:
+            handler = _lookup_by_type(_FIND_FILTER_CONTENT_HANDLERS, element)
+            if handler is not None and handler(element, dest, stack):
+                found = True
+
+    return content, found
 
 
 def _get_filter_content(
@@ -181,9 +309,10 @@ def _get_filter_content(
         return src
 
     # We want to look for one or more "filter" blocks, possibly behind
-    # conditions.
-    content = _find_filter_content(src)
-    if not content and at_root is None:
+    # conditions. If unsure, we fall back to the root if no such block has
+    # been found, even if conditions have been found.
+    content, found = _find_filter_content(src)
+    if not found and at_root is None:
         return src
 
     return content
@@ -212,38 +341,67 @@ def parse_logstash_filters(
 # ---
 
 
-def _render_as_lscl_content(filters: LogstashFilters, /) -> LsclContent:
+def _render_filter_as_lscl(
+    element: LogstashFilter,
+    dest: LsclContent,
+    stack: list[tuple[LsclContent, LogstashFilters]],
+    /,
+    *,
+    sort_keys: bool,
+) -> None:
+    """Add a block rendered from a filter.
+
+    :param element: Filter to render.
+    :param dest: List to add the rendered block to.
+    :param stack: Stack to schedule walks on, unused here.
+    :param sort_keys: Whether to sort the configuration keys.
+    """
+    items: Iterable[tuple[str, LsclData]] = element.config.items()
+    if sort_keys:
+        items = sorted(items)
+
+    # NOTE: Filter and attribute names are not constrained on the filter
+    #       models, hence the blocks and attributes are still validated to
+    #       ensure they can be rendered.
+    dest.append(
+        LsclBlock(
+            name=element.name,
+            content=[
+                LsclAttribute(name=key, content=value) for key, value in items
+            ],
+        ),
+    )
+
+
+def _render_as_lscl_content(
+    filters: LogstashFilters,
+    /,
+    *,
+    sort_keys: bool = True,
+) -> LsclContent:
     """Render a list of filters or branching as LSCL content.
 
+    Nested branching bodies are walked using an explicit stack rather than
+    recursion.
+
     :param filters: Filters or branching.
+    :param sort_keys: Whether to sort the configuration keys of filters.
     :return: Rendered LSCL content.
     """
+    handlers: dict[type, Callable[[Any, Any, Any], None]] = {
+        LogstashFilter: partial(_render_filter_as_lscl, sort_keys=sort_keys),
+        LogstashFilterBranching: _walk_conditions,
+    }
     content: LsclContent = []
-    for element in filters:
-        if isinstance(element, LogstashFilter):
-            content.append(
-                LsclBlock(
-                    name=element.name,
-                    content=[
-                        LsclAttribute(name=key, content=value)
-                        for key, value in sorted(element.config.items())
-                    ],
-                ),
-            )
-        elif isinstance(element, LogstashFilterBranching):
-            content.append(
-                LsclConditions(
-                    conditions=[
-                        (cond, _render_as_lscl_content(body))
-                        for cond, body in element.conditions
-                    ],
-                    default=(
-                        _render_as_lscl_content(element.default)
-                        if element.default is not None
-                        else None
-                    ),
-                ),
-            )
+    stack: list[tuple[LsclContent, LogstashFilters]] = [(content, filters)]
+
+    while stack:
+        dest, items = stack.pop()
+
+        for element in items:
+            handler = _lookup_by_type(handlers, element)
+            if handler is not None:
+                handler(element, dest, stack)
 
     return content
 
@@ -258,6 +416,7 @@ def render_logstash_filters(
         "ampersand",
         "none",
     ] = "none",
+    sort_keys: bool = True,
 ) -> str:
     """Render Logstash filters.
 
@@ -267,6 +426,8 @@ def render_logstash_filters(
     :param field_reference_escape_style: The
         ``config.field_reference.escape_style`` value in the configuration
         of the target environment.
+    :param sort_keys: Whether to render the configuration of each filter
+        with its keys sorted, or in their insertion order.
     :return: Filters encoded using LSCL.
     :raises StringRenderingError: A string could not be rendered due to
         invalid characters being present.
@@ -274,7 +435,7 @@ def render_logstash_filters(
         due to invalid characters being in one of its elements.
     """
     return render_as_lscl(
-        _render_as_lscl_content(filters),
+        _render_as_lscl_content(filters, sort_keys=sort_keys),
         escapes_supported=escapes_supported,
         field_reference_escape_style=field_reference_escape_style,
     )
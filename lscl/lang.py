@@ -32,10 +32,16 @@ from __future__ import annotations
 
 from decimal import Decimal
 import re
+import sys
 from typing import Annotated, Union
 
 from annotated_types import Len
-from pydantic import BaseModel, StringConstraints
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    StringConstraints,
+)
 from typing_extensions import TypeAliasType
 
 
@@ -104,6 +110,8 @@ class LsclLiteral(BaseModel):
     It will not be returned in parsing results.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     content: str
     """String contents."""
 
@@ -114,8 +122,16 @@ class LsclLiteral(BaseModel):
 class LsclSelector(BaseModel):
     """Selector for evaluating a variable within a condition."""
 
+    model_config = ConfigDict(defer_build=True)
+
     names: Annotated[
-        list[Annotated[str, StringConstraints(min_length=1)]],
+        list[
+            Annotated[
+                str,
+                StringConstraints(min_length=1),
+                AfterValidator(sys.intern),
+            ]
+        ],
         Len(min_length=1),
     ]
     """Name of the variable to evaluate."""
@@ -124,60 +140,53 @@ class LsclSelector(BaseModel):
 class LsclMethodCall(BaseModel):
     """Method call."""
 
-    name: str
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[str, AfterValidator(sys.intern)]
     """Name of the function to call."""
 
     params: list[LsclRValue] = []
     """Parameters."""
 
 
-class LsclAnd(BaseModel):
-    """And condition."""
+class _LsclLogicalCondition(BaseModel):
+    """Logical condition between a list of conditions."""
+
+    model_config = ConfigDict(defer_build=True)
 
     conditions: list[LsclCondition]
     """List of conditions."""
 
 
-class LsclOr(BaseModel):
-    """Or condition."""
+class LsclAnd(_LsclLogicalCondition):
+    """And condition."""
 
-    conditions: list[LsclCondition]
-    """List of conditions."""
 
+class LsclOr(_LsclLogicalCondition):
+    """Or condition."""
 
-class LsclXor(BaseModel):
-    """Xor condition."""
 
-    conditions: list[LsclCondition]
-    """List of conditions."""
+class LsclXor(_LsclLogicalCondition):
+    """Xor condition."""
 
 
-class LsclNand(BaseModel):
+class LsclNand(_LsclLogicalCondition):
     """Nand condition."""
 
-    conditions: list[LsclCondition]
-    """Condition to inverse the result of the and of."""
-
 
 class LsclNot(BaseModel):
     """Not condition."""
 
+    model_config = ConfigDict(defer_build=True)
+
     condition: LsclCondition
     """Condition to inverse the result of."""
 
 
-class LsclIn(BaseModel):
-    """In condition."""
-
-    needle: LsclRValue
-    """Needle to look for."""
-
-    haystack: LsclRValue
-    """Haystack in which to look for the needle."""
+class _LsclMembershipCondition(BaseModel):
+    """Condition on the presence of a needle in a haystack."""
 
-
-class LsclNotIn(BaseModel):
-    """Not in condition."""
+    model_config = ConfigDict(defer_build=True)
 
     needle: LsclRValue
     """Needle to look for."""
@@ -186,28 +195,18 @@ class LsclNotIn(BaseModel):
     """Haystack in which to look for the needle."""
 
 
-class LsclEqualTo(BaseModel):
-    """Equal condition."""
-
-    first: LsclRValue
-    """First value."""
-
-    second: LsclRValue
-    """Second value."""
-
+class LsclIn(_LsclMembershipCondition):
+    """In condition."""
 
-class LsclNotEqualTo(BaseModel):
-    """Not equal condition."""
 
-    first: LsclRValue
-    """First value."""
+class LsclNotIn(_LsclMembershipCondition):
+    """Not in condition."""
 
-    second: LsclRValue
-    """Second value."""
 
+class _LsclComparisonCondition(BaseModel):
+    """Comparison between two values."""
 
-class LsclGreaterThan(BaseModel):
-    """Greater than condition."""
+    model_config = ConfigDict(defer_build=True)
 
     first: LsclRValue
     """First value."""
@@ -216,38 +215,34 @@ class LsclGreaterThan(BaseModel):
     """Second value."""
 
 
-class LsclGreaterThanOrEqualTo(BaseModel):
-    """Greater than condition."""
+class LsclEqualTo(_LsclComparisonCondition):
+    """Equal condition."""
 
-    first: LsclRValue
-    """First value."""
 
-    second: LsclRValue
-    """Second value."""
+class LsclNotEqualTo(_LsclComparisonCondition):
+    """Not equal condition."""
 
 
-class LsclLessThan(BaseModel):
+class LsclGreaterThan(_LsclComparisonCondition):
     """Greater than condition."""
 
-    first: LsclRValue
-    """First value."""
 
-    second: LsclRValue
-    """Second value."""
+class LsclGreaterThanOrEqualTo(_LsclComparisonCondition):
+    """Greater than or equal condition."""
 
 
-class LsclLessThanOrEqualTo(BaseModel):
-    """Greater than condition."""
+class LsclLessThan(_LsclComparisonCondition):
+    """Less than condition."""
 
-    first: LsclRValue
-    """First value."""
 
-    second: LsclRValue
-    """Second value."""
+class LsclLessThanOrEqualTo(_LsclComparisonCondition):
+    """Less than or equal condition."""
 
 
-class LsclMatch(BaseModel):
-    """Condition to see if an rvalue matches a pattern."""
+class _LsclPatternCondition(BaseModel):
+    """Condition on an rvalue and a pattern."""
+
+    model_config = ConfigDict(defer_build=True)
 
     value: LsclRValue
     """Value to match."""
@@ -256,14 +251,12 @@ class LsclMatch(BaseModel):
     """Pattern."""
 
 
-class LsclNotMatch(BaseModel):
-    """Condition to see if an rvalue does not match a pattern."""
+class LsclMatch(_LsclPatternCondition):
+    """Condition to see if an rvalue matches a pattern."""
 
-    value: LsclRValue
-    """Value to match."""
 
-    pattern: re.Pattern
-    """Pattern."""
+class LsclNotMatch(_LsclPatternCondition):
+    """Condition to see if an rvalue does not match a pattern."""
 
 
 # ---
@@ -281,6 +274,8 @@ LsclContent = TypeAliasType(
 class LsclConditions(BaseModel):
     """Condition with content."""
 
+    model_config = ConfigDict(defer_build=True)
+
     conditions: Annotated[
         list[tuple[LsclCondition, LsclContent]],
         Len(min_length=1),
@@ -294,7 +289,13 @@ class LsclConditions(BaseModel):
 class LsclAttribute(BaseModel):
     """Data with a name."""
 
-    name: Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9_-]+$")]
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[
+        str,
+        StringConstraints(pattern=r"^[A-Za-z0-9_-]+$"),
+        AfterValidator(sys.intern),
+    ]
     """Name of the data."""
 
     content: LsclData = {}
@@ -304,19 +305,14 @@ class LsclAttribute(BaseModel):
 class LsclBlock(BaseModel):
     """Block with a name."""
 
-    name: Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9_-]+$")]
+    model_config = ConfigDict(defer_build=True)
+
+    name: Annotated[
+        str,
+        StringConstraints(pattern=r"^[A-Za-z0-9_-]+$"),
+        AfterValidator(sys.intern),
+    ]
     """Name of the block."""
 
     content: LsclContent = []
     """Content, as a list of named blocks, named data, and conditions."""
-
-
-# HACK: Resolve circular dependencies.
-LsclMethodCall.model_rebuild()
-LsclSelector.model_rebuild()
-LsclAnd.model_rebuild()
-LsclOr.model_rebuild()
-LsclXor.model_rebuild()
-LsclNot.model_rebuild()
-LsclConditions.model_rebuild()
-LsclAttribute.model_rebuild()
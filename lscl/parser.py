@@ -40,12 +40,13 @@ the original language without adding too much.
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from itertools import chain
+from functools import lru_cache, partial
 import re
-from typing import Literal, Union
+from typing import Any, Literal, Union
 
 from pydantic import BaseModel
 
@@ -88,16 +89,23 @@ __all__ = ["parse_lscl"]
 
 
 _LSCL_TOKEN_PATTERN = re.compile(
-    r"(#[^\n]*)|\[([^\[\],]+)\]"
-    + r"|(=>|==|!=|<=|>=|<|>|=~|!~|\{|\}|\[|\]|\(|\)|!|,)"
-    + r'|"((?:\\.|[^"])*)"|\'((?:\\.|[^\'])*)\'|/((?:\\.|[^/])*)/'
-    + r"|([A-Za-z0-9\._-]+)",
-    re.MULTILINE,
+    r"\[(?P<selector_element>[^\[\],]+)\]"
+    + r"|(?P<symbol>=>|==|!=|<=|>=|<|>|=~|!~|\{|\}|\[|\]|\(|\)|!|,)"
+    + r'|"(?P<dquot>[^"\\]*(?:\\.[^"\\]*)*\\?)"'
+    + r"|'(?P<squot>[^'\\]*(?:\\.[^'\\]*)*\\?)'"
+    + r"|/(?P<pattern>[^/\\]*(?:\\.[^/\\]*)*\\?)/"
+    + r"|(?P<word>[A-Za-z0-9\._-]+)",
+    re.MULTILINE | re.DOTALL,
 )
 """Pattern used by the lexer to match raw tokens from a string.
 
-Case 1. Inline comment.
-Case 2. Selector element.
+Every case is captured in its own named group, so that the lexer can
+dispatch on the name of the matched group.
+
+Inline comments are not matched here, but skipped along with whitespace
+using :py:data:`_LSCL_SKIPPED_PATTERN`.
+
+Case 1. Selector element.
     Note that this is NOT equivalent to [<bareword>], as the content of the
     selector element has access to a broader set of characters.
     However, just because a selector element is matched does not mean that
@@ -105,7 +113,7 @@ Case 2. Selector element.
     one or more elements that will need to be re-parsed in the context of
     data parsing.
 
-Case 3. Special symbols.
+Case 2. Special symbols.
     In order: attribute marker (=>), equal to (==),
     different from (!=), less or equal to (<=), greater or equal to (>=),
     less than (<), greater than (>), match to regex (=~),
@@ -113,10 +121,16 @@ Case 3. Special symbols.
     left bracket ([), right bracket (]), left parenthesis ("("),
     right parenthesis (")"), exclamation mark (!), comma (,).
 
-Case 4. Double quoted string.
-Case 5. Single quoted string.
-Case 6. Pattern.
-Case 7. Bareword, number, and digit barewords.
+Case 3. Double quoted string.
+Case 4. Single quoted string.
+Case 5. Pattern.
+    These three cases use the "unrolled loop" form, where runs of regular
+    characters are matched at once rather than alternating between escape
+    sequences and regular characters for every character. The optional
+    backslash before the closing delimiter matches the same strings as the
+    alternating form, where a backslash directly preceding the closing
+    delimiter may end up being matched as a regular character.
+Case 6. Bareword, number, and digit barewords.
     This also matches special bareword-compatible tokens, including
     "if", "else", "in", "not", "and", "or", "xor", "nand".
 
@@ -128,6 +142,12 @@ two characters, but that may be an oversight that could be fixed later, so
 we want to support one-character barewords.
 """
 
+_LSCL_SKIPPED_PATTERN = re.compile(r"(?:\s+|#[^\n]*)*")
+"""Pattern used by the lexer to skip whitespace and comments between tokens.
+
+Comments run until the end of the line, and are not yielded as tokens.
+"""
+
 _LSCL_NUMBER_PATTERN = re.compile(r"-?[0-9]+(?:\.[0-9]*)?")
 """Number pattern."""
 
@@ -269,7 +289,8 @@ LsclSimpleTokenType = Literal[
 """Token types that can be represented using :py:class:`LsclSimpleToken`."""
 
 
-class LsclSimpleToken(BaseModel):
+@dataclass(kw_only=True, slots=True)
+class LsclSimpleToken:
     """LSCL token with no additional components."""
 
     type: LsclSimpleTokenType
@@ -285,7 +306,8 @@ class LsclSimpleToken(BaseModel):
     """Offset at which the token starts, counting from 0."""
 
 
-class LsclNumberToken(BaseModel):
+@dataclass(kw_only=True, slots=True)
+class LsclNumberToken:
     """LSCL token with a numeric value."""
 
     type: Literal[LsclTokenType.NUMBER]
@@ -307,7 +329,8 @@ class LsclNumberToken(BaseModel):
     """Offset at which the token starts, counting from 0."""
 
 
-class LsclStringToken(BaseModel):
+@dataclass(kw_only=True, slots=True)
+class LsclStringToken:
     """LSCL token with a string value."""
 
     type: Literal[
@@ -366,165 +389,270 @@ _LSCL_SIMPLE_TOKEN_MAPPING: dict[str, LsclSimpleTokenType] = {
 """Mapping from symbols and keywords to simple token types."""
 
 
-def parse_lscl_tokens(
+_LSCL_SINGLE_CHARACTER_TOKEN_TYPES: dict[str, LsclSimpleTokenType] = {
+    "{": LsclTokenType.LBRACE,
+    "}": LsclTokenType.RBRACE,
+    "]": LsclTokenType.RBRK,
+    "(": LsclTokenType.LPAREN,
+    ")": LsclTokenType.RPAREN,
+    ",": LsclTokenType.COMMA,
+}
+"""Token types for symbols that can be recognized from their first character.
+
+Left brackets and exclamation marks are not present here, since they may
+start selector elements and longer symbols respectively.
+"""
+
+
+def _lex_lscl_symbol(value: str, runk: Runk, /) -> LsclToken:
+    """Lex a special symbol.
+
+    :param value: Raw symbol.
+    :param runk: Position of the symbol.
+    :return: Obtained token.
+    """
+    try:
+        token_type = _LSCL_SIMPLE_TOKEN_MAPPING[value]
+    except KeyError as exc:  # pragma: no cover
+        raise NotImplementedError() from exc
+
+    return LsclSimpleToken(
+        type=token_type,
+        line=runk.line,
+        column=runk.column,
+        offset=runk.offset,
+    )
+
+
+def _lex_lscl_string(
+    value: str,
+    runk: Runk,
+    /,
+    *,
+    token_type: Literal[
+        LsclTokenType.SELECTOR_ELEMENT,
+        LsclTokenType.DQUOT,
+        LsclTokenType.SQUOT,
+        LsclTokenType.PATTERN,
+    ],
+) -> LsclToken:
+    """Lex a selector element, string or pattern.
+
+    :param value: Raw content of the token.
+    :param runk: Position of the token.
+    :param token_type: Type of the token to produce.
+    :return: Obtained token.
+    """
+    return LsclStringToken(
+        type=token_type,
+        value=value,
+        line=runk.line,
+        column=runk.column,
+        offset=runk.offset,
+    )
+
+
+@lru_cache(maxsize=512)
+def _lex_lscl_number(raw: str, /) -> int | Decimal:
+    """Get the value of a number.
+
+    This is cached since the same numbers, e.g. ports or counts, tend to be
+    used multiple times within configurations. Both integers and decimals
+    are immutable, hence can be shared between tokens.
+
+    :param raw: Raw number, matching :py:data:`_LSCL_NUMBER_PATTERN`.
+    :return: Value of the number.
+    """
+    if "." in raw:
+        return Decimal(raw)
+
+    return int(raw)
+
+
+def _lex_lscl_word(value: str, runk: Runk, /) -> LsclToken:
+    """Lex a bareword, digit, or bareword number.
+
+    :param value: Raw word.
+    :param runk: Position of the word.
+    :return: Obtained token.
+    """
+    try:
+        token_type = _LSCL_SIMPLE_TOKEN_MAPPING[value]
+    except KeyError:
+        pass
+    else:
+        return LsclSimpleToken(
+            type=token_type,
+            line=runk.line,
+            column=runk.column,
+            offset=runk.offset,
+        )
+
+    if _LSCL_NUMBER_PATTERN.fullmatch(value):
+        return LsclNumberToken(
+            type=LsclTokenType.NUMBER,
+            value=_lex_lscl_number(value),
+            raw=value,
+            line=runk.line,
+            column=runk.column,
+            offset=runk.offset,
+        )
+
+    return LsclStringToken(
+        type=(
+            LsclTokenType.BAREWORD
+            if _LSCL_BAREWORD_PATTERN.fullmatch(value)
+            else LsclTokenType.DIGIT_BAREWORD
+        ),
+        value=value,
+        line=runk.line,
+        column=runk.column,
+        offset=runk.offset,
+    )
+
+
+_LSCL_TOKEN_HANDLERS: dict[str, Callable[[str, Runk], LsclToken]] = {
+    # WARNING: We do *not* want to strip the selector element here, as it
+    # may produce invalid line, column and offset counts if re-parsing the
+    # content in the context of data parsing.
+    "selector_element": partial(
+        _lex_lscl_string,
+        token_type=LsclTokenType.SELECTOR_ELEMENT,
+    ),
+    "symbol": _lex_lscl_symbol,
+    "dquot": partial(_lex_lscl_string, token_type=LsclTokenType.DQUOT),
+    "squot": partial(_lex_lscl_string, token_type=LsclTokenType.SQUOT),
+    "pattern": partial(_lex_lscl_string, token_type=LsclTokenType.PATTERN),
+    "word": _lex_lscl_word,
+}
+"""Handlers for producing tokens, by name of the matched group.
+
+See :py:data:`_LSCL_TOKEN_PATTERN` for the group names.
+"""
+
+
+def _lex_lscl_tokens(
     raw: str,
     /,
     *,
     runk: Runk | None = None,
-) -> Iterator[LsclToken]:
-    """Parse a string as a series of Logstash configuration tokens.
+) -> list[LsclToken]:
+    """Lex a string into a list of Logstash configuration tokens.
 
-    This always emits a :py:class:`LsclSimpleToken` with
-    type :py:attr:`LsclTokenType.END` after all others, so that
-    the caller does not need to handle :py:exc:`StopIteration` as a "normal"
-    exception.
+    The parser always consumes all tokens, hence these are produced as a
+    list rather than through a generator.
 
     :param raw: Raw string from which to extract tokens.
-    :param runk: Initial line, column and offset counter. This can be used to
-        parse a substring starting after the content start.
-    :return: Token iterator.
+    :param runk: Initial line, column and offset counter.
+    :return: Tokens, ending with a token of type
+        :py:attr:`LsclTokenType.END`.
     :raises DecodeError: A decoding error has occurred.
     """
     if runk is None:
         runk = Runk()
 
+    # NOTE: We keep the raw string as is and only move a position within it,
+    #       since slicing the remaining string for every token would make
+    #       lexing quadratic on the size of the input.
+    tokens: list[LsclToken] = []
+    add_token = tokens.append
+    pos = 0
+    end = len(raw)
+
+    # Bind the objects used for every token locally.
+    match_skipped = _LSCL_SKIPPED_PATTERN.match
+    match_token = _LSCL_TOKEN_PATTERN.match
+    handlers = _LSCL_TOKEN_HANDLERS
+    single_token_types = _LSCL_SINGLE_CHARACTER_TOKEN_TYPES
+    count_range = runk.count_range
+
     while True:
-        # First, remove the leading whitespace, and check if there is still
-        # contents in the string.
-        stripped_raw = raw.lstrip()
-        runk.count(raw[: len(raw) - len(stripped_raw)])
-        if not stripped_raw:
+        # First, skip the leading whitespace and comments, and check if
+        # there is still contents in the string.
+        skipped_end = match_skipped(raw, pos).end()  # type: ignore
+        count_range(raw, pos, skipped_end)
+        pos = skipped_end
+        if pos >= end:
             break
 
-        raw = stripped_raw
-        match = _LSCL_TOKEN_PATTERN.match(raw)
-        if match is None:
-            if len(raw) > 30:
-                raw = raw[:27] + "..."
-
-            raise DecodeError(
-                f"Could not parse configuration starting from: {raw}",
-                line=runk.line,
-                column=runk.column,
-                offset=runk.offset,
-            )
-
-        if match[1] is not None:
-            # Case 1. Inline comment.
-            # We do not actually yield it, ignoring it is enough.
-            pass
-        elif match[2] is not None:
-            # Case 2. Selector elements.
-            # WARNING: We do *not* want to strip the obtained string here,
-            # as it may produce invalid line, column and offset counts if
-            # re-parsing the content in the context of data parsing.
-            yield LsclStringToken(
-                type=LsclTokenType.SELECTOR_ELEMENT,
-                value=match[2],
-                line=runk.line,
-                column=runk.column,
-                offset=runk.offset,
-            )
-        elif match[3] is not None:
-            # Case 3. Special symbols.
-            try:
-                yield LsclSimpleToken(
-                    type=_LSCL_SIMPLE_TOKEN_MAPPING[match[3]],
+        # Unambiguous single character symbols are frequent, and can be
+        # recognized without matching the token pattern.
+        single_token_type = single_token_types.get(raw[pos])
+        if single_token_type is not None:
+            add_token(
+                LsclSimpleToken(
+                    type=single_token_type,
                     line=runk.line,
                     column=runk.column,
                     offset=runk.offset,
-                )
-            except KeyError as exc:  # pragma: no cover
-                raise NotImplementedError() from exc
-        elif match[4] is not None:
-            # Case 4. Double quoted string.
-            yield LsclStringToken(
-                type=LsclTokenType.DQUOT,
-                value=match[4],
-                line=runk.line,
-                column=runk.column,
-                offset=runk.offset,
-            )
-        elif match[5] is not None:
-            # Case 5. Single quoted string.
-            yield LsclStringToken(
-                type=LsclTokenType.SQUOT,
-                value=match[5],
-                line=runk.line,
-                column=runk.column,
-                offset=runk.offset,
+                ),
             )
-        elif match[6] is not None:
-            # Case 6. Pattern.
-            yield LsclStringToken(
-                type=LsclTokenType.PATTERN,
-                value=match[6],
+
+            # NOTE: None of these symbols are newlines.
+            pos += 1
+            runk.column += 1
+            runk.offset += 1
+            continue
+
+        match = match_token(raw, pos)
+        if match is None:
+            if end - pos > 30:
+                rest = raw[pos : pos + 27] + "..."
+            else:
+                rest = raw[pos:]
+
+            raise DecodeError(
+                f"Could not parse configuration starting from: {rest}",
                 line=runk.line,
                 column=runk.column,
                 offset=runk.offset,
             )
-        elif match[7] is not None:
-            # Case 7. Bareword, digit, or bareword number.
-            raw_word = match[7]
-            try:
-                yield LsclSimpleToken(
-                    type=_LSCL_SIMPLE_TOKEN_MAPPING[raw_word],
-                    line=runk.line,
-                    column=runk.column,
-                    offset=runk.offset,
-                )
-            except KeyError:
-                if _LSCL_NUMBER_PATTERN.fullmatch(raw_word):
-                    if "." in raw_word:
-                        number: int | Decimal = Decimal(raw_word)
-                    else:
-                        number = int(raw_word)
-
-                    yield LsclNumberToken(
-                        type=LsclTokenType.NUMBER,
-                        value=number,
-                        raw=raw_word,
-                        line=runk.line,
-                        column=runk.column,
-                        offset=runk.offset,
-                    )
-                elif _LSCL_BAREWORD_PATTERN.fullmatch(raw_word):
-                    yield LsclStringToken(
-                        type=LsclTokenType.BAREWORD,
-                        value=raw_word,
-                        line=runk.line,
-                        column=runk.column,
-                        offset=runk.offset,
-                    )
-                else:
-                    yield LsclStringToken(
-                        type=LsclTokenType.DIGIT_BAREWORD,
-                        value=raw_word,
-                        line=runk.line,
-                        column=runk.column,
-                        offset=runk.offset,
-                    )
-        else:  # pragma: no cover
-            raise NotImplementedError()
 
-        runk.count(match[0])
-        raw = raw[match.end() :]
+        # NOTE: Exactly one named group matches, hence the last group
+        #       always being defined here.
+        group: str = match.lastgroup  # type: ignore
+        add_token(handlers[group](match[group], runk))
 
-    yield LsclSimpleToken(
-        type=LsclTokenType.END,
-        line=runk.line,
-        column=runk.column,
-        offset=runk.offset,
+        pos = match.end()
+        count_range(raw, match.start(), pos)
+
+    add_token(
+        LsclSimpleToken(
+            type=LsclTokenType.END,
+            line=runk.line,
+            column=runk.column,
+            offset=runk.offset,
+        ),
     )
+    return tokens
+
+
+def parse_lscl_tokens(
+    raw: str,
+    /,
+    *,
+    runk: Runk | None = None,
+) -> Iterator[LsclToken]:
+    """Parse a string as a series of Logstash configuration tokens.
+
+    This always emits a :py:class:`LsclSimpleToken` with
+    type :py:attr:`LsclTokenType.END` after all others, so that
+    the caller does not need to handle :py:exc:`StopIteration` as a "normal"
+    exception.
+
+    :param raw: Raw string from which to extract tokens.
+    :param runk: Initial line, column and offset counter. This can be used to
+        parse a substring starting after the content start.
+    :return: Token iterator.
+    :raises DecodeError: A decoding error has occurred.
+    """
+    yield from _lex_lscl_tokens(raw, runk=runk)
 
 
 # ---
 # Parser.
 # ---
 
-_LSCL_STRING_ESCAPE_PATTERN = re.compile(r"\\(.)")
-"""Pattern used to unescape quoted strings."""
-
 _LSCL_STRING_ESCAPE_CHARACTERS = {
     '"': '"',
     "'": "'",
@@ -536,7 +664,7 @@ _LSCL_STRING_ESCAPE_CHARACTERS = {
 }
 """Valid characters for escape sequences.
 
-This definition, along with :py:func:`_unescape_lscl_string`, is in the parser
+This definition, along with :py:func:`_parse_lscl_string`, is in the parser
 rather than in the lexer, because escaping support can be disabled in the
 parser configuration, just as in Logstash.
 
@@ -555,6 +683,38 @@ _LSCL_AMPERSAND_SEQUENCE_PATTERN = re.compile(r"&#([0-9]{2,});")
 """Pattern used to unescape ampersand-encoded sequences."""
 
 
+_LSCL_QUOTED_STRING_TOKEN_TYPES: frozenset[
+    Literal[LsclTokenType.SQUOT, LsclTokenType.DQUOT]
+] = frozenset(
+    (LsclTokenType.SQUOT, LsclTokenType.DQUOT),
+)
+"""Types of tokens representing quoted strings."""
+
+_LSCL_DATA_VALUE_TOKEN_TYPES: frozenset[
+    Literal[LsclTokenType.BAREWORD, LsclTokenType.NUMBER]
+] = frozenset(
+    (LsclTokenType.BAREWORD, LsclTokenType.NUMBER),
+)
+"""Types of tokens whose value can be used as is as data."""
+
+_LSCL_RVALUE_VALUE_TOKEN_TYPES: frozenset[
+    Literal[LsclTokenType.PATTERN, LsclTokenType.NUMBER]
+] = frozenset(
+    (LsclTokenType.PATTERN, LsclTokenType.NUMBER),
+)
+"""Types of tokens whose value can be used as is as an rvalue."""
+
+_LSCL_NAME_VALUE_TOKEN_TYPES: frozenset[
+    Literal[LsclTokenType.BAREWORD, LsclTokenType.DIGIT_BAREWORD]
+] = frozenset(
+    (LsclTokenType.BAREWORD, LsclTokenType.DIGIT_BAREWORD),
+)
+"""Types of tokens whose value can be used as is as a block or attribute name.
+
+Note that numbers can also be used as names, using their raw value.
+"""
+
+
 class _LsclParsingOptions(BaseModel):
     """Parsing options for LSCL."""
 
@@ -577,6 +737,49 @@ class _LsclParsingOptions(BaseModel):
     """Escaping to expect from selector elements."""
 
 
+class _LsclTokenIterator:
+    """Iterator over a materialized list of tokens.
+
+    Tokens are all lexed beforehand, so that reading a token is a plain
+    list access rather than resuming the lexer, and so that the next token
+    can be peeked at without being consumed.
+    """
+
+    __slots__ = ("_tokens", "_index")
+
+    _tokens: list[LsclToken]
+    """Tokens to iterate over."""
+
+    _index: int
+    """Index of the next token to read."""
+
+    def __init__(self, tokens: list[LsclToken], /) -> None:
+        self._tokens = tokens
+        self._index = 0
+
+    def __iter__(self, /) -> _LsclTokenIterator:
+        return self
+
+    def __next__(self, /) -> LsclToken:
+        # NOTE: The lexer always emits an END token last, which the parser
+        #       never reads past, hence the end of the list not being
+        #       reached in practice.
+        try:
+            token = self._tokens[self._index]
+        except IndexError:  # pragma: no cover
+            raise StopIteration() from None
+
+        self._index += 1
+        return token
+
+    def peek(self, /) -> LsclToken:
+        """Get the next token without consuming it.
+
+        :return: Next token.
+        """
+        return self._tokens[self._index]
+
+
 class UnexpectedLsclToken(DecodeError):
     """An unexpected token was obtained."""
 
@@ -585,14 +788,25 @@ class UnexpectedLsclToken(DecodeError):
 
     def __init__(self, token: LsclToken, /) -> None:
         super().__init__(
-            f"Unexpected token {token.type.name} at line {token.line}, "
-            + f"column {token.column}",
+            None,
             line=token.line,
             column=token.column,
             offset=token.offset,
         )
+        self.args = (token,)
         self.token = token
 
+    def __reduce__(self, /) -> tuple[Any, ...]:
+        return (type(self), (self.token,))
+
+    def __str__(self, /) -> str:
+        # NOTE: The position is already given by the decoding error prefix,
+        #       hence it not being repeated in the message.
+        return (
+            f"At line {self.line}, column {self.column}: "
+            + f"unexpected token {self.token.type.name}"
+        )
+
 
 def _parse_lscl_string(
     token: LsclStringToken,
@@ -607,13 +821,29 @@ def _parse_lscl_string(
         strings.
     :return: Obtained string.
     """
-    if not options.support_escapes:
-        return token.value
+    raw = token.value
+    if not options.support_escapes or "\\" not in raw:
+        return raw
+
+    # Runs of characters between backslashes are looked for using
+    # ``str.find``, and copied as is. Unknown escape sequences, and a
+    # trailing backslash, are kept as is.
+    find = raw.find
+    get_escape = _LSCL_STRING_ESCAPE_CHARACTERS.get
+    parts: list[str] = []
+    start = 0
+    while True:
+        end = find("\\", start)
+        if end < 0:
+            parts.append(raw[start:])
+            break
 
-    return _LSCL_STRING_ESCAPE_PATTERN.sub(
-        lambda match: _LSCL_STRING_ESCAPE_CHARACTERS.get(match[1], match[0]),
-        token.value,
-    )
+        parts.append(raw[start:end])
+        sequence = raw[end : end + 2]
+        parts.append(get_escape(sequence[1:], sequence))
+        start = end + 2
+
+    return "".join(parts)
 
 
 def _parse_lscl_selector(
@@ -656,10 +886,11 @@ def _parse_lscl_selector(
 
 
 def _parse_lscl_data(
-    token_iter: Iterator[LsclToken],
+    token_iter: _LsclTokenIterator,
     /,
     *,
     options: _LsclParsingOptions,
+    first_token: LsclToken | None = None,
 ) -> LsclData:
     """Parse LSCL data.
 
@@ -667,27 +898,34 @@ def _parse_lscl_data(
 
     :param token_iter: Token iterator.
     :param options: Parsing options.
+    :param first_token: First token of the data, if already read by the
+        caller.
     :return: Parsed data.
     """
     # TODO: We don't support plugins yet, as named blocks. Maybe it should
     # be supported? Not sure...
-    token = next(token_iter)
-    if token.type in (LsclTokenType.BAREWORD, LsclTokenType.NUMBER):
+    token = next(token_iter) if first_token is None else first_token
+    if token.type in _LSCL_DATA_VALUE_TOKEN_TYPES:
         return token.value
 
-    if token.type in (LsclTokenType.SQUOT, LsclTokenType.DQUOT):
+    if token.type in _LSCL_QUOTED_STRING_TOKEN_TYPES:
         return _parse_lscl_string(token, options=options)
 
     if token.type == LsclTokenType.SELECTOR_ELEMENT:
         # The element is a single-element list matched as a selector.
         # We actually need to re-parse the tokens within the selector.
+        # NOTE: The contents of the selector are lexed entirely before
+        #       being parsed, hence these being refused if they contain
+        #       characters that cannot be lexed, even after the first value.
         value = _parse_lscl_data(
-            parse_lscl_tokens(
-                token.value,
-                runk=Runk(
-                    line=token.line,
-                    column=token.column + 1,  # Ignore initial '['.
-                    offset=token.offset + 1,  # Ignore initial '['.
+            _LsclTokenIterator(
+                _lex_lscl_tokens(
+                    token.value,
+                    runk=Runk(
+                        line=token.line,
+                        column=token.column + 1,  # Ignore initial '['.
+                        offset=token.offset + 1,  # Ignore initial '['.
+                    ),
                 ),
             ),
             options=options,
@@ -711,11 +949,11 @@ def _parse_lscl_data(
 
                 break
 
-            # We need to reinsert the token into the iterator, then parse
-            # the value here.
+            # The token we have read is the first one of the value.
             value = _parse_lscl_data(
-                chain(iter([token]), token_iter),
+                token_iter,
                 options=options,
+                first_token=token,
             )
             lst.append(value)
 
@@ -759,10 +997,11 @@ def _parse_lscl_data(
 
 
 def _parse_lscl_rvalue(
-    token_iter: Iterator[LsclToken],
+    token_iter: _LsclTokenIterator,
     /,
     *,
     options: _LsclParsingOptions,
+    first_token: LsclToken | None = None,
 ) -> tuple[LsclRValue, LsclToken]:
     """Parse an LSCL right-value within the context of a condition.
 
@@ -772,13 +1011,15 @@ def _parse_lscl_rvalue(
 
     :param token_iter: Token iterator.
     :param options: Parsing options.
+    :param first_token: First token of the right-value, if already read by
+        the caller.
     :return: Parsed condition, and first token after the condition.
     """
-    token = next(token_iter)
-    if token.type in (LsclTokenType.PATTERN, LsclTokenType.NUMBER):
+    token = next(token_iter) if first_token is None else first_token
+    if token.type in _LSCL_RVALUE_VALUE_TOKEN_TYPES:
         return token.value, next(token_iter)
 
-    if token.type in (LsclTokenType.SQUOT, LsclTokenType.DQUOT):
+    if token.type in _LSCL_QUOTED_STRING_TOKEN_TYPES:
         return _parse_lscl_string(token, options=options), next(token_iter)
 
     if token.type == LsclTokenType.SELECTOR_ELEMENT:
@@ -807,11 +1048,11 @@ def _parse_lscl_rvalue(
 
                 break
 
-            # We need to reinsert the token into the iterator, then parse
-            # the value here.
+            # The token we have read is the first one of the value.
             value = _parse_lscl_data(
-                chain(iter([token]), token_iter),
+                token_iter,
                 options=options,
+                first_token=token,
             )
             lst.append(value)
 
@@ -850,8 +1091,9 @@ def _parse_lscl_rvalue(
             break
 
         rvalue, token = _parse_lscl_rvalue(
-            chain(iter((token,)), token_iter),
+            token_iter,
             options=options,
+            first_token=token,
         )
         params.append(rvalue)
 
@@ -866,8 +1108,49 @@ def _parse_lscl_rvalue(
     return LsclMethodCall(name=method, params=params), next(token_iter)
 
 
+_LSCL_COMPARISON_CONDITIONS: dict[
+    LsclTokenType,
+    type[
+        LsclEqualTo
+        | LsclNotEqualTo
+        | LsclLessThanOrEqualTo
+        | LsclGreaterThanOrEqualTo
+        | LsclLessThan
+        | LsclGreaterThan
+    ],
+] = {
+    LsclTokenType.EQ: LsclEqualTo,
+    LsclTokenType.NEQ: LsclNotEqualTo,
+    LsclTokenType.LTE: LsclLessThanOrEqualTo,
+    LsclTokenType.GTE: LsclGreaterThanOrEqualTo,
+    LsclTokenType.LT: LsclLessThan,
+    LsclTokenType.GT: LsclGreaterThan,
+}
+"""Comparison conditions, by operator token type."""
+
+_LSCL_PATTERN_CONDITIONS: dict[
+    LsclTokenType,
+    type[LsclMatch | LsclNotMatch],
+] = {
+    LsclTokenType.MATCH: LsclMatch,
+    LsclTokenType.NMATCH: LsclNotMatch,
+}
+"""Pattern matching conditions, by operator token type."""
+
+_LSCL_LOGICAL_CONDITIONS: dict[
+    LsclTokenType,
+    type[LsclAnd | LsclOr | LsclXor | LsclNand],
+] = {
+    LsclTokenType.AND: LsclAnd,
+    LsclTokenType.OR: LsclOr,
+    LsclTokenType.XOR: LsclXor,
+    LsclTokenType.NAND: LsclNand,
+}
+"""Logical conditions, by operator token type."""
+
+
 def _parse_lscl_condition(
-    token_iter: Iterator[LsclToken],
+    token_iter: _LsclTokenIterator,
     /,
     *,
     options: _LsclParsingOptions,
@@ -922,8 +1205,9 @@ def _parse_lscl_condition(
             token = next(token_iter)
         else:
             first, token = _parse_lscl_rvalue(
-                chain(iter((token,)), token_iter),
+                token_iter,
                 options=options,
+                first_token=token,
             )
 
             if token.type == LsclTokenType.IN:
@@ -938,55 +1222,27 @@ def _parse_lscl_condition(
 
                 second, token = _parse_lscl_rvalue(token_iter, options=options)
                 new = LsclNotIn(needle=first, haystack=second)
-            elif token.type == LsclTokenType.EQ:
-                # "<rvalue> == <rvalue>" (eq)
-                second, token = _parse_lscl_rvalue(token_iter, options=options)
-                new = LsclEqualTo(first=first, second=second)
-            elif token.type == LsclTokenType.NEQ:
-                # "<rvalue> != <rvalue>" (neq)
-                second, token = _parse_lscl_rvalue(token_iter, options=options)
-                new = LsclNotEqualTo(first=first, second=second)
-            elif token.type == LsclTokenType.LTE:
-                # "<rvalue> <= <rvalue>" (lte)
+            elif token.type in _LSCL_COMPARISON_CONDITIONS:
+                # "<rvalue> == <rvalue>" (eq), "<rvalue> != <rvalue>" (neq),
+                # "<rvalue> <= <rvalue>" (lte), "<rvalue> >= <rvalue>" (gte),
+                # "<rvalue> < <rvalue>" (lt), "<rvalue> > <rvalue>" (gt)
+                comparison_type = _LSCL_COMPARISON_CONDITIONS[token.type]
                 second, token = _parse_lscl_rvalue(token_iter, options=options)
-                new = LsclLessThanOrEqualTo(first=first, second=second)
-            elif token.type == LsclTokenType.GTE:
-                # "<rvalue> >= <rvalue>" (gte)
-                second, token = _parse_lscl_rvalue(token_iter, options=options)
-                new = LsclGreaterThanOrEqualTo(first=first, second=second)
-            elif token.type == LsclTokenType.LT:
-                # "<rvalue> < <rvalue>" (lt)
-                second, token = _parse_lscl_rvalue(token_iter, options=options)
-                new = LsclLessThan(first=first, second=second)
-            elif token.type == LsclTokenType.GT:
-                # "<rvalue> > <rvalue>" (gt)
-                second, token = _parse_lscl_rvalue(token_iter, options=options)
-                new = LsclGreaterThan(first=first, second=second)
-            elif token.type == LsclTokenType.MATCH:
+                new = comparison_type(first=first, second=second)
+            elif token.type in _LSCL_PATTERN_CONDITIONS:
                 # "<rvalue> =~ <squot>", "<rvalue> =~ <dquot>",
-                # "<rvalue> =~ <pattern>" (match)
-                token = next(token_iter)
-                if token.type == LsclTokenType.PATTERN:
-                    pattern = token.value
-                elif token.type in (LsclTokenType.SQUOT, LsclTokenType.DQUOT):
-                    pattern = _parse_lscl_string(token, options=options)
-                else:
-                    raise UnexpectedLsclToken(token)
-
-                new = LsclMatch(value=first, pattern=pattern)
-                token = next(token_iter)
-            elif token.type == LsclTokenType.NMATCH:
-                # "<rvalue> !~ <squot>", "<rvalue> !~ <dquot>",
-                # "<rvalue> !~ <pattern>" (nmatch)
+                # "<rvalue> =~ <pattern>" (match), and same with "!~"
+                # (nmatch)
+                pattern_condition_type = _LSCL_PATTERN_CONDITIONS[token.type]
                 token = next(token_iter)
                 if token.type == LsclTokenType.PATTERN:
                     pattern = token.value
-                elif token.type in (LsclTokenType.SQUOT, LsclTokenType.DQUOT):
+                elif token.type in _LSCL_QUOTED_STRING_TOKEN_TYPES:
                     pattern = _parse_lscl_string(token, options=options)
                 else:
                     raise UnexpectedLsclToken(token)
 
-                new = LsclNotMatch(value=first, pattern=pattern)
+                new = pattern_condition_type(value=first, pattern=pattern)
                 token = next(token_iter)
             else:
                 # "<rvalue>" (rvalue)
@@ -1007,26 +1263,18 @@ def _parse_lscl_condition(
         if token.type == end_token_type:
             break
 
-        if token.type == LsclTokenType.AND:
-            if not isinstance(current, LsclAnd):
-                current = LsclAnd(conditions=[new])
-        elif token.type == LsclTokenType.OR:
-            if not isinstance(current, LsclOr):
-                current = LsclOr(conditions=[new])
-        elif token.type == LsclTokenType.XOR:
-            if not isinstance(current, LsclXor):
-                current = LsclXor(conditions=[new])
-        elif token.type == LsclTokenType.NAND:
-            if not isinstance(current, LsclNand):
-                current = LsclNand(conditions=[new])
-        else:
+        logical_condition_type = _LSCL_LOGICAL_CONDITIONS.get(token.type)
+        if logical_condition_type is None:
             raise UnexpectedLsclToken(token)
 
+        if not isinstance(current, logical_condition_type):
+            current = logical_condition_type(conditions=[new])
+
     return new
 
 
 def _parse_lscl_content(
-    token_iter: Iterator[LsclToken],
+    token_iter: _LsclTokenIterator,
     /,
     *,
     options: _LsclParsingOptions,
@@ -1034,103 +1282,133 @@ def _parse_lscl_content(
 ) -> LsclContent:
     """Parse an LSCL block.
 
+    Nested blocks and condition branches are parsed using an explicit stack
+    rather than recursively, so that deeply nested configurations do not
+    hit the recursion limit. Every frame contains the content of the
+    enclosing block, then either the name of the block being parsed, or
+    the list of conditions to which the branch being parsed belongs,
+    then whether the branch being parsed is the default branch.
+
     :param token_iter: Token iterator.
     :param options: Parsing options.
     :param end_token_type: Type of the ending token for the block.
     :return: Parsed block.
     """
     content: LsclContent = []
+    stack: list[
+        tuple[
+            LsclContent,
+            str | list[tuple[LsclCondition, LsclContent]],
+            bool,
+        ]
+    ] = []
+    add_frame = stack.append
+    read_token = token_iter.__next__
+    peek_token = token_iter.peek
+    if_type = LsclTokenType.IF
+    else_type = LsclTokenType.ELSE
+    lbrace_type = LsclTokenType.LBRACE
+    rbrace_type = LsclTokenType.RBRACE
+    attr_type = LsclTokenType.ATTR
+    current_end_token_type = end_token_type
 
     # Parse the first token.
     # This is not done at the beginning of the loop, because in case of
     # conditions, we need to peek at the next token.
-    token = next(token_iter)
+    token = read_token()
+    ttype = token.type
 
-    while token.type != end_token_type:
-        # Every possibility starts with a name.
-        if token.type == LsclTokenType.IF:
-            # We have an "if <condition> {" structure.
-            initial_condition = _parse_lscl_condition(
-                token_iter,
-                options=options,
-                end_token_type=LsclTokenType.LBRACE,
-            )
-
-            conditions: list[tuple[LsclCondition, LsclContent]] = [
-                (
-                    initial_condition,
-                    _parse_lscl_content(token_iter, options=options),
-                ),
-            ]
-            default_content: LsclContent | None = None
-
-            # We may have "else" blocks here, which we need to evaluate.
-            while True:
-                token = next(token_iter)
-                if token.type != LsclTokenType.ELSE:
-                    # The token is the beginning of a new element within the
-                    # currently parsed block, or the block sentinel.
-                    break
+    while True:
+        if ttype is current_end_token_type:
+            if not stack:
+                return content
+
+            child_content = content
+            content, frame_data, is_default = stack.pop()
+            if not stack:
+                current_end_token_type = end_token_type
+
+            if isinstance(frame_data, str):
+                content.append(
+                    LsclBlock(name=frame_data, content=child_content),
+                )
+            elif is_default:
+                content.append(
+                    LsclConditions(
+                        conditions=frame_data,
+                        default=child_content,
+                    ),
+                )
+            elif peek_token().type is not else_type:
+                # The next token is the beginning of a new element within the
+                # currently parsed block, or the block sentinel.
+                content.append(
+                    LsclConditions(conditions=frame_data, default=None),
+                )
+            else:
+                # We have an "else" block, for which we skip the "else".
+                read_token()
 
                 # The next token is either an "if" or a left brace.
-                token = next(token_iter)
-                if token.type == LsclTokenType.LBRACE:
-                    default_content = _parse_lscl_content(
-                        token_iter,
-                        options=options,
-                    )
-
-                    # Since the 'else' has marked an explicit end to the
-                    # branching, we must get the next token manually,
-                    # instead of automatically as above.
-                    token = next(token_iter)
-                    break
-
-                if token.type == LsclTokenType.IF:
+                token = read_token()
+                ttype = token.type
+                if ttype is lbrace_type:
+                    add_frame((content, frame_data, True))
+                    content = []
+                elif ttype is if_type:
                     # "else if <condition> {" structure.
                     other_condition = _parse_lscl_condition(
                         token_iter,
                         options=options,
-                        end_token_type=LsclTokenType.LBRACE,
+                        end_token_type=lbrace_type,
                     )
 
-                    conditions.append(
-                        (
-                            other_condition,
-                            _parse_lscl_content(token_iter, options=options),
-                        ),
-                    )
+                    add_frame((content, frame_data, False))
+                    content = []
+                    frame_data.append((other_condition, content))
                 else:
                     raise UnexpectedLsclToken(token)
 
-            content.append(
-                LsclConditions(
-                    conditions=conditions,
-                    default=default_content,
-                ),
+                current_end_token_type = rbrace_type
+
+            token = read_token()
+            ttype = token.type
+            continue
+
+        # Every possibility starts with a name.
+        if ttype is if_type:
+            # We have an "if <condition> {" structure.
+            initial_condition = _parse_lscl_condition(
+                token_iter,
+                options=options,
+                end_token_type=lbrace_type,
             )
+
+            branch_content: LsclContent = []
+            add_frame((content, [(initial_condition, branch_content)], False))
+            content = branch_content
+            current_end_token_type = rbrace_type
+            token = read_token()
+            ttype = token.type
             continue
 
+        # NOTE: The token type is compared to module-level constants here,
+        #       for type checkers to narrow the token type.
         if token.type == LsclTokenType.NUMBER:
             name = token.raw
-        elif token.type in (
-            LsclTokenType.BAREWORD,
-            LsclTokenType.DIGIT_BAREWORD,
-        ):
+        elif token.type in _LSCL_NAME_VALUE_TOKEN_TYPES:
             name = token.value
         else:
             raise UnexpectedLsclToken(token)
 
-        op_token = next(token_iter)
-        if op_token.type == LsclTokenType.LBRACE:
+        op_token = read_token()
+        op_type = op_token.type
+        if op_type is lbrace_type:
             # We have a "bareword {" structure, introducing a block.
-            content.append(
-                LsclBlock(
-                    name=name,
-                    content=_parse_lscl_content(token_iter, options=options),
-                ),
-            )
-        elif op_token.type == LsclTokenType.ATTR:
+            add_frame((content, name, False))
+            content = []
+            current_end_token_type = rbrace_type
+        elif op_type is attr_type:
             # We have a "bareword =>" structure, introducing an
             # assignment to data.
             content.append(
@@ -1142,9 +1420,8 @@ def _parse_lscl_content(
         else:
             raise UnexpectedLsclToken(op_token)
 
-        token = next(token_iter)
-
-    return content
+        token = read_token()
+        ttype = token.type
 
 
 def parse_lscl(
@@ -1161,6 +1438,10 @@ def parse_lscl(
 ) -> LsclContent:
     """Parse a string as an Logstash Configuration Language block.
 
+    The string is lexed entirely before being parsed, hence characters that
+    cannot be lexed being reported even if a syntax error occurs earlier in
+    the string.
+
     :param raw: Text to parse as an LSCL block.
     :param accept_trailing_commas: Whether to accept trailing commas in the
         input.
@@ -1170,7 +1451,7 @@ def parse_lscl(
     :return: Obtained blocks, attributes and conditions.
     :raises DecodeError: A decode error.
     """
-    token_iter = iter(parse_lscl_tokens(raw))
+    token_iter = _LsclTokenIterator(_lex_lscl_tokens(raw))
     return _parse_lscl_content(
         token_iter,
         options=_LsclParsingOptions(
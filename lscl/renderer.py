@@ -30,11 +30,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 import re
-from typing import Literal, Union
+from typing import Any, Literal, TextIO, Union, overload
 
-from pydantic import BaseModel, TypeAdapter
 from typing_extensions import TypeAliasType
 
 from .errors import SelectorElementRenderingError, StringRenderingError
@@ -65,6 +67,7 @@ from .lang import (
     LsclSelector,
     LsclXor,
 )
+from .utils import _lookup_by_type
 
 
 LsclRenderable = TypeAliasType(
@@ -80,33 +83,19 @@ LsclRenderable = TypeAliasType(
 )
 """Renderable entities."""
 
-_BAREWORD_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]+")
-"""Pattern to check if a word can be replaced as a direct bareword."""
+_DOUBLE_QUOTE_STRING_ESCAPE_DISABLED_INVALID_CHARACTERS = ('"', "\0", "\r")
+"""Characters that cannot be rendered in double quote strings without escapes.
 
-_STRING_ESCAPE_PATTERN = re.compile(r"[\\\\\"'\0\n\r\t]")
-"""Pattern to match sequences to escape."""
-
-_PATTERN_ESCAPE_PATTERN = re.compile(r"[/]")
-"""Pattern to match sequences to escape in patterns."""
+Other characters that would be escaped otherwise, i.e. backslashes,
+newlines and tabs, are rendered as is.
+"""
 
-_BASE_STRING_ESCAPE_DISABLED_REPLACEMENTS = {
-    "\\": "\\",
-    "\n": "\n",
-    "\t": "\t",
-}
-"""Replacements to use when string escapes are disabled."""
+_SINGLE_QUOTE_STRING_ESCAPE_DISABLED_INVALID_CHARACTERS = ("'", "\0", "\r")
+"""Characters that cannot be rendered in single quote strings without escapes.
 
-_DOUBLE_QUOTE_STRING_ESCAPE_DISABLED_REPLACEMENTS = {
-    **_BASE_STRING_ESCAPE_DISABLED_REPLACEMENTS,
-    "'": "'",
-}
-"""Replacements for chars to escape when double string escaping is disabled."""
-
-_SINGLE_QUOTE_STRING_ESCAPE_DISABLED_REPLACEMENTS = {
-    **_BASE_STRING_ESCAPE_DISABLED_REPLACEMENTS,
-    '"': '"',
-}
-"""Replacements for chars to escape when single string escaping is disabled."""
+Other characters that would be escaped otherwise, i.e. backslashes,
+newlines and tabs, are rendered as is.
+"""
 
 _BASE_STRING_ESCAPE_REPLACEMENTS = {
     "\\": "\\\\",
@@ -114,33 +103,22 @@ _BASE_STRING_ESCAPE_REPLACEMENTS = {
     "\n": "\\n",
     "\r": "\\r",
     "\t": "\\t",
-    '"': '"',
-    "'": "'",
 }
 """Replacements for escape sequences in all strings."""
 
-_DOUBLE_QUOTE_STRING_ESCAPE_REPLACEMENTS = {
-    **_BASE_STRING_ESCAPE_REPLACEMENTS,
-    '"': '\\"',
-}
-"""Replacements for escape sequences in double quote strings."""
-
-_SINGLE_QUOTE_STRING_ESCAPE_REPLACEMENTS = {
-    **_BASE_STRING_ESCAPE_REPLACEMENTS,
-    "'": "\\'",
-}
-"""Replacements for escape sequences in single quote strings."""
-
-
-class _LsclContentMatcher(BaseModel):
-    value: LsclContent
-
+_DOUBLE_QUOTE_STRING_ESCAPE_TABLE = str.maketrans(
+    {**_BASE_STRING_ESCAPE_REPLACEMENTS, '"': '\\"'},
+)
+"""Translation table for escape sequences in double quote strings."""
 
-class _LsclListMatcher(BaseModel):
-    value: list[LsclData] | dict[str | LsclLiteral, LsclData]
+_SINGLE_QUOTE_STRING_ESCAPE_TABLE = str.maketrans(
+    {**_BASE_STRING_ESCAPE_REPLACEMENTS, "'": "\\'"},
+)
+"""Translation table for escape sequences in single quote strings."""
 
 
-_lscl_list_type_adapter = TypeAdapter(_LsclContentMatcher | _LsclListMatcher)
+_CONTENT_TYPES = (LsclBlock, LsclAttribute, LsclConditions)
+"""Types of the elements of an LSCL content list."""
 
 
 # ---
@@ -148,7 +126,12 @@ _lscl_list_type_adapter = TypeAdapter(_LsclContentMatcher | _LsclListMatcher)
 # ---
 
 
-class _LsclRenderingOptions(BaseModel):
+_FIELD_REFERENCE_ESCAPE_STYLES = frozenset(("percent", "ampersand", "none"))
+"""Supported field reference escape styles."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _LsclRenderingOptions:
     """Renderer options for LSCL."""
 
     escapes_supported: bool
@@ -158,46 +141,80 @@ class _LsclRenderingOptions(BaseModel):
     """Escape style of field references."""
 
 
-def _render_lscl_string(
+@lru_cache(maxsize=4096)
+def _render_cached_lscl_string(
     raw: str,
+    escapes_supported: bool,
+    use_barewords: bool,
     /,
-    *,
-    options: _LsclRenderingOptions,
-    use_barewords: bool = False,
 ) -> str:
-    """Render an LSCL string for any context.
+    """Render an LSCL string, with a cache.
+
+    The same strings, e.g. field names, tend to be rendered many times
+    within the same configuration, hence the cache. Options are passed
+    as separate values so that they can be used in the cache key.
 
     :param raw: Raw string to render.
-    :param options: Rendering options.
+    :param escapes_supported: Whether escapes are supported.
+    :param use_barewords: Whether to render the string as a bareword if
+        possible.
     :return: Rendered string.
     """
-    if use_barewords and _BAREWORD_PATTERN.fullmatch(raw):
+    # NOTE: ASCII identifiers match the bareword pattern from the original
+    #       grammar, i.e. [A-Za-z_][A-Za-z0-9_]+, provided that they have
+    #       at least two characters. While the parser accepts one-character
+    #       barewords, the original grammar does not, hence one-character
+    #       words being rendered as quoted strings so that the output can
+    #       be read by Logstash.
+    if (
+        use_barewords
+        and len(raw) >= 2
+        and raw.isascii()
+        and raw.isidentifier()
+    ):
         return raw
 
     if '"' not in raw or "'" in raw:
         delimiter = '"'
-        if options.escapes_supported:
-            replacements = _DOUBLE_QUOTE_STRING_ESCAPE_REPLACEMENTS
-        else:
-            replacements = _DOUBLE_QUOTE_STRING_ESCAPE_DISABLED_REPLACEMENTS
+        table = _DOUBLE_QUOTE_STRING_ESCAPE_TABLE
+        invalid_chars = _DOUBLE_QUOTE_STRING_ESCAPE_DISABLED_INVALID_CHARACTERS
     else:
         delimiter = "'"
-        if options.escapes_supported:
-            replacements = _SINGLE_QUOTE_STRING_ESCAPE_REPLACEMENTS
-        else:
-            replacements = _SINGLE_QUOTE_STRING_ESCAPE_DISABLED_REPLACEMENTS
+        table = _SINGLE_QUOTE_STRING_ESCAPE_TABLE
+        invalid_chars = _SINGLE_QUOTE_STRING_ESCAPE_DISABLED_INVALID_CHARACTERS
 
-    def repl(m: re.Match, /) -> str:
-        """Replace the provided match with the corresponding escape code."""
-        try:
-            return replacements[m[0]]
-        except KeyError:
+    if escapes_supported:
+        return delimiter + raw.translate(table) + delimiter
+
+    for char in invalid_chars:
+        if char in raw:
             raise StringRenderingError(string=raw)
 
-    raw = _STRING_ESCAPE_PATTERN.sub(repl, raw)
     return delimiter + raw + delimiter
 
 
+def _render_lscl_string(
+    raw: str,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    use_barewords: bool = False,
+) -> str:
+    """Render an LSCL string for any context.
+
+    :param raw: Raw string to render.
+    :param options: Rendering options.
+    :param use_barewords: Whether to render the string as a bareword if
+        possible.
+    :return: Rendered string.
+    """
+    return _render_cached_lscl_string(
+        raw,
+        options.escapes_supported,
+        use_barewords,
+    )
+
+
 def _render_lscl_pattern(
     raw: re.Pattern,
     /,
@@ -210,102 +227,181 @@ def _render_lscl_pattern(
     :param options: Rendering options.
     :return: Rendered string.
     """
-    escaped = _PATTERN_ESCAPE_PATTERN.sub(
-        lambda match: "\\" + match[0],
-        raw.pattern,
-    )
+    # NOTE: Slashes are the only characters to escape in patterns.
+    escaped = raw.pattern.replace("/", "\\/")
     return f"/{escaped}/"
 
 
+def _render_lscl_literal_data(
+    content: LsclLiteral,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+) -> str:
+    """Render an LSCL literal as data.
+
+    :param content: Content to render.
+    :param options: Rendering options, unused here.
+    :return: Rendered data.
+    """
+    return content.content
+
+
+def _render_lscl_bool_data(
+    content: bool,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+) -> str:
+    """Render a boolean as LSCL data.
+
+    :param content: Content to render.
+    :param options: Rendering options, unused here.
+    :return: Rendered data.
+    """
+    return "true" if content else "false"
+
+
+def _render_lscl_number_data(
+    content: int | float | Decimal,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+) -> str:
+    """Render a number as LSCL data.
+
+    :param content: Content to render.
+    :param options: Rendering options, unused here.
+    :return: Rendered data.
+    """
+    return str(content)
+
+
+def _render_lscl_string_data(
+    content: str,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+) -> str:
+    """Render a string as LSCL data.
+
+    :param content: Content to render.
+    :param options: Rendering options.
+    :return: Rendered data.
+    """
+    return _render_lscl_string(content, options=options, use_barewords=True)
+
+
+_SCALAR_DATA_RENDERERS: dict[type, Callable[..., str]] = {
+    str: _render_lscl_string_data,
+    int: _render_lscl_number_data,
+    LsclLiteral: _render_lscl_literal_data,
+    bool: _render_lscl_bool_data,
+    Decimal: _render_lscl_number_data,
+    float: _render_lscl_number_data,
+}
+"""Renderers for data that do not contain other data, by exact type.
+
+Subclasses of these types are looked up in order, after the exact type
+lookup has missed. Booleans are always found by the exact type lookup,
+since :py:class:`bool` cannot be subclassed, hence them never being
+rendered as integers despite integers being placed first.
+"""
+
+
 def _render_lscl_data(
     content: LsclData,
     /,
     *,
     options: _LsclRenderingOptions,
     prefix: str,
-) -> str:
+    write: Callable[[str], object],
+    end: str = "\n",
+) -> None:
     """Render LSCL data.
 
     This function considers that the beginning is already indented correctly,
-    and always adds a newline at the end.
+    and always ends with the provided end, a newline by default.
 
     :param content: Content to render.
     :param options: Rendering options.
     :param prefix: Prefix to render with.
-    :return: Rendered content.
+    :param write: Function to call with every rendered fragment.
+    :param end: String to render at the end of the data.
     """
-    if isinstance(content, LsclLiteral):
-        return content.content + "\n"
+    render_scalar = _SCALAR_DATA_RENDERERS.get(type(content))
+    if render_scalar is not None:
+        write(render_scalar(content, options=options) + end)
+        return
 
     if isinstance(content, dict):
         if not content:
-            return "{}\n"
+            write("{}" + end)
+            return
 
-        rendered = "{\n"
+        child_prefix = prefix + "  "
+        write("{\n")
         for key, value in content.items():
             if isinstance(key, LsclLiteral):
                 rendered_key = key.content
-            else:
+            elif isinstance(key, str):
                 rendered_key = _render_lscl_string(
                     key,
                     options=options,
                     use_barewords=True,
                 )
-
-            rendered += (
-                prefix
-                + "  "
-                + rendered_key
-                + " => "
-                + _render_lscl_data(
-                    value,
-                    options=options,
-                    prefix=prefix + "  ",
+            else:
+                raise TypeError(
+                    f"Unable to render {type(key)} into an LSCL key.",
                 )
+
+            write(child_prefix + rendered_key + " => ")
+            _render_lscl_data(
+                value,
+                options=options,
+                prefix=child_prefix,
+                write=write,
             )
 
-        return rendered + prefix + "}\n"
+        write(prefix + "}" + end)
+        return
 
     if isinstance(content, list):
         if not content:
-            return "[]\n"
+            write("[]" + end)
+            return
 
-        rendered = "[\n"
+        child_prefix = prefix + "  "
+        write("[\n")
+        last_index = len(content) - 1
         for i, value in enumerate(content):
-            rendered += (
-                prefix
-                + "  "
-                + _render_lscl_data(
-                    value,
-                    options=options,
-                    prefix=prefix + "  ",
-                )
+            write(child_prefix)
+            _render_lscl_data(
+                value,
+                options=options,
+                prefix=child_prefix,
+                write=write,
+                end=",\n" if i < last_index else "\n",
             )
-            if i < len(content) - 1:
-                rendered = rendered[:-1] + ",\n"
 
-        return rendered + prefix + "]\n"
+        write(prefix + "]" + end)
+        return
 
-    if isinstance(content, bool):
-        return "true\n" if content else "false\n"
+    # The data may be of a subclass of one of the scalar types.
+    render_scalar = _lookup_by_type(_SCALAR_DATA_RENDERERS, content)
+    if render_scalar is None:
+        raise TypeError(f"Unable to render {type(content)} into LSCL.")
 
-    if isinstance(content, (int, float, Decimal)):
-        return str(content) + "\n"
-
-    if isinstance(content, str):
-        return (
-            _render_lscl_string(content, options=options, use_barewords=True)
-            + "\n"
-        )
+    write(render_scalar(content, options=options) + end)
 
-    raise NotImplementedError()  # pragma: no cover
 
+_PERCENT_ENCODING_PATTERN = re.compile(r"%([0-9A-F]{2})|[\[\],]")
+"""Pattern to use to find characters that require percent-encoding.
 
-_PERCENT_ENCODING_PATTERN = re.compile(r"%([0-9A-F]{2})")
-"""Pattern to use to find percent signs that require percent-encoding.
-
-This is done because '%' not followed by two uppercase hexadecimal digits
-are **not** unescaped, hence there is no need to percent-encode them.
+This matches square brackets and commas, as well as percent signs followed
+by two uppercase hexadecimal digits. '%' not followed by two uppercase
+hexadecimal digits are **not** unescaped, hence there is no need to
+percent-encode them.
 
 See `PERCENT EscapeHandler`_ for more information.
 
@@ -315,10 +411,14 @@ See `PERCENT EscapeHandler`_ for more information.
     logstash/util/EscapeHandler.java#L26
 """
 
-_AMPERSAND_ENCODING_PATTERN = re.compile(r"&#([0-9]{2,});")
-"""Pattern to use to find ampersands that require ampersand-encoding.
+_PERCENT_ENCODED_CHARACTERS = {"[": "%5B", "]": "%5D", ",": "%2C"}
+"""Percent-encoded versions of characters matched as a whole."""
+
+_AMPERSAND_ENCODING_PATTERN = re.compile(r"&#([0-9]{2,});|[\[\],]")
+"""Pattern to use to find characters that require ampersand-encoding.
 
-This is done because '&' that do not introduce valid ampersand patterns
+This matches square brackets and commas, as well as ampersands introducing
+valid ampersand patterns. '&' that do not introduce valid ampersand patterns
 are **not** unescaped, hence there is no need to ampersand-encode them.
 
 .. _AMPERSAND EscapeHandler:
@@ -327,46 +427,103 @@ are **not** unescaped, hence there is no need to ampersand-encode them.
     logstash/util/EscapeHandler.java#L53
 """
 
+_AMPERSAND_ENCODED_CHARACTERS = {"[": "&#91;", "]": "&#93;", ",": "&#44;"}
+"""Ampersand-encoded versions of characters matched as a whole."""
+
+
+def _percent_encode_match(match: re.Match, /) -> str:
+    """Percent-encode a match of the percent encoding pattern.
+
+    :param match: Match to encode.
+    :return: Encoded match.
+    """
+    digits = match[1]
+    if digits is not None:
+        return "%25" + digits
+
+    return _PERCENT_ENCODED_CHARACTERS[match[0]]
+
+
+def _ampersand_encode_match(match: re.Match, /) -> str:
+    """Ampersand-encode a match of the ampersand encoding pattern.
+
+    :param match: Match to encode.
+    :return: Encoded match.
+    """
+    digits = match[1]
+    if digits is not None:
+        return "&#38;#" + digits + ";"
+
+    return _AMPERSAND_ENCODED_CHARACTERS[match[0]]
+
+
+_SELECTOR_ELEMENT_ENCODERS: dict[
+    str,
+    tuple[re.Pattern, Callable[[re.Match], str]],
+] = {
+    "percent": (_PERCENT_ENCODING_PATTERN, _percent_encode_match),
+    "ampersand": (_AMPERSAND_ENCODING_PATTERN, _ampersand_encode_match),
+}
+"""Pattern and replacement function for each field reference escape style.
+
+As opposed to Logstash's escape functions, we also encode commas.
+"""
+
 
-def _render_lscl_selector_element(
+@lru_cache(maxsize=4096)
+def _render_cached_lscl_selector_element(
     element: str,
+    field_reference_escape_style: Literal["percent", "ampersand", "none"],
     /,
-    *,
-    options: _LsclRenderingOptions,
 ) -> str:
-    """Render an LSCL selector element.
+    """Render an LSCL selector element, with a cache.
 
-    :param content: Content to render.
-    :param options: Rendering options.
-    :return: Rendered selector.
+    The same field names tend to be referenced many times within the same
+    configuration, hence the cache.
+
+    :param element: Selector element to render.
+    :param field_reference_escape_style: Escape style of field references.
+    :return: Rendered selector element.
     """
-    if options.field_reference_escape_style == "none":
+    if field_reference_escape_style == "none":
         if "[" in element or "]" in element or "," in element:
             raise SelectorElementRenderingError(selector_element=element)
-    elif options.field_reference_escape_style == "percent":
-        # NOTE: As opposed to Logstash's percent escape function, we
-        #       also escape commas.
-        element = (
-            _PERCENT_ENCODING_PATTERN.sub(r"%25\1", element)
-            .replace("[", "%5B")
-            .replace("]", "%5D")
-            .replace(",", "%2C")
-        )
-    elif options.field_reference_escape_style == "ampersand":
-        # NOTE: As opposed to Logstash's ampersand escape function, we
-        #       also escape commas.
-        element = (
-            _AMPERSAND_ENCODING_PATTERN.sub(r"&#38;#\1;", element)
-            .replace("[", "&#91;")
-            .replace("]", "&#93;")
-            .replace(",", "&#44;")
-        )
-    else:  # pragma: no cover
-        raise NotImplementedError()
+    else:
+        pattern, encode = _SELECTOR_ELEMENT_ENCODERS[
+            field_reference_escape_style
+        ]
+        element = pattern.sub(encode, element)
 
     return f"[{element}]"
 
 
+@lru_cache(maxsize=4096)
+def _render_cached_lscl_selector(
+    names: tuple[str, ...],
+    field_reference_escape_style: Literal["percent", "ampersand", "none"],
+    /,
+) -> str:
+    """Render an LSCL selector, with a cache.
+
+    The same selectors tend to be used in many conditions within the same
+    configuration, hence the cache. Selectors being mutable models, their
+    names are provided as a tuple to be used in the cache key.
+
+    :param names: Names of the selector elements to render.
+    :param field_reference_escape_style: Escape style of field references.
+    :return: Rendered selector.
+    """
+    return "".join(
+        [
+            _render_cached_lscl_selector_element(
+                name,
+                field_reference_escape_style,
+            )
+            for name in names
+        ],
+    )
+
+
 def _render_lscl_selector(
     content: LsclSelector,
     /,
@@ -379,53 +536,302 @@ def _render_lscl_selector(
     :param options: Rendering options.
     :return: Rendered selector.
     """
-    return "".join(
-        _render_lscl_selector_element(name, options=options)
-        for name in content.names
+    return _render_cached_lscl_selector(
+        tuple(content.names),
+        options.field_reference_escape_style,
     )
 
 
-def _render_lscl_rvalue(
-    content: LsclRValue,
+def _render_lscl_rvalue_as_data(
+    content: list[LsclData] | LsclLiteral,
     /,
     *,
     options: _LsclRenderingOptions,
     prefix: str,
 ) -> str:
-    """Render an LSCL right-value.
+    """Render an LSCL list or literal right-value.
 
     :param content: Content to render.
     :param options: Rendering options.
     :param prefix: Prefix to render with.
     :return: Rendered right-value.
     """
-    if isinstance(content, (list, LsclLiteral)):
-        return _render_lscl_data(content, options=options, prefix=prefix)[:-1]
+    fragments: list[str] = []
+    _render_lscl_data(
+        content,
+        options=options,
+        prefix=prefix,
+        write=fragments.append,
+        end="",
+    )
+    return "".join(fragments)
+
 
-    if isinstance(content, LsclSelector):
-        return _render_lscl_selector(content, options=options)
+def _render_lscl_rvalue_selector(
+    content: LsclSelector,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL selector right-value.
+
+    :param content: Content to render.
+    :param options: Rendering options.
+    :param prefix: Prefix to render with, unused here.
+    :return: Rendered right-value.
+    """
+    return _render_lscl_selector(content, options=options)
+
+
+def _render_lscl_method_call(
+    content: LsclMethodCall,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL method call.
 
-    if isinstance(content, LsclMethodCall):
-        return (
-            f"{content.name}("
-            + ", ".join(
+    :param content: Content to render.
+    :param options: Rendering options.
+    :param prefix: Prefix to render with.
+    :return: Rendered right-value.
+    """
+    return (
+        f"{content.name}("
+        + ", ".join(
+            [
                 _render_lscl_rvalue(param, options=options, prefix=prefix)
                 for param in content.params
-            )
-            + ")"
+            ],
         )
+        + ")"
+    )
 
-    if isinstance(content, str):
-        return _render_lscl_string(
-            content,
-            options=options,
-            use_barewords=False,
-        )
 
-    if isinstance(content, (int, bool, float, Decimal)):
-        return str(content)
+def _render_lscl_rvalue_string(
+    content: str,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL string right-value.
+
+    Barewords are not used here, since they would be method calls.
+
+    :param content: Content to render.
+    :param options: Rendering options.
+    :param prefix: Prefix to render with, unused here.
+    :return: Rendered right-value.
+    """
+    return _render_lscl_string(content, options=options, use_barewords=False)
+
+
+def _render_lscl_rvalue_number(
+    content: int | float | Decimal,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL number right-value.
+
+    :param content: Content to render.
+    :param options: Rendering options, unused here.
+    :param prefix: Prefix to render with, unused here.
+    :return: Rendered right-value.
+    """
+    return str(content)
+
+
+_RVALUE_RENDERERS: dict[type, Callable[..., str]] = {
+    str: _render_lscl_rvalue_string,
+    int: _render_lscl_rvalue_number,
+    LsclSelector: _render_lscl_rvalue_selector,
+    list: _render_lscl_rvalue_as_data,
+    LsclLiteral: _render_lscl_rvalue_as_data,
+    LsclMethodCall: _render_lscl_method_call,
+    Decimal: _render_lscl_rvalue_number,
+    float: _render_lscl_rvalue_number,
+    bool: _render_lscl_rvalue_number,
+}
+"""Renderers for right-values, by exact type.
+
+Right-values of subclasses of these types are rendered as their base type.
+"""
+
 
-    raise NotImplementedError()  # pragma: no cover
+def _render_lscl_rvalue(
+    content: LsclRValue,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL right-value.
+
+    :param content: Content to render.
+    :param options: Rendering options.
+    :param prefix: Prefix to render with.
+    :return: Rendered right-value.
+    """
+    renderer = _lookup_by_type(_RVALUE_RENDERERS, content)
+    if renderer is None:
+        raise TypeError(f"Unable to render {type(content)} into LSCL.")
+
+    return renderer(content, options=options, prefix=prefix)
+
+
+_LOGICAL_CONDITION_OPERATORS: dict[type, str] = {
+    LsclAnd: " and ",
+    LsclOr: " or ",
+    LsclXor: " xor ",
+    LsclNand: " nand ",
+}
+"""Operators for logical conditions, by exact type."""
+
+_BINARY_CONDITION_OPERATORS: dict[type, str] = {
+    LsclIn: " in ",
+    LsclNotIn: " not in ",
+    LsclEqualTo: " == ",
+    LsclNotEqualTo: " != ",
+    LsclGreaterThanOrEqualTo: " >= ",
+    LsclLessThanOrEqualTo: " <= ",
+    LsclGreaterThan: " > ",
+    LsclLessThan: " < ",
+    LsclMatch: " =~ ",
+    LsclNotMatch: " !~ ",
+}
+"""Operators for conditions between two values, by exact type."""
+
+
+def _get_condition_operator(
+    operators: dict[type, str],
+    content: Any,
+    /,
+) -> str:
+    """Get the operator for a condition.
+
+    :param operators: Operators, by exact condition type.
+    :param content: Condition to get the operator for.
+    :return: Operator.
+    :raises TypeError: The condition is of no type in the operators.
+    """
+    operator = _lookup_by_type(operators, content)
+    if operator is None:  # pragma: no cover
+        # NOTE: Conditions are only rendered with operators once their
+        #       renderer has been found using the same types, hence this
+        #       not being reachable through rendering.
+        raise TypeError(f"Unable to render {type(content)} into LSCL.")
+
+    return operator
+
+
+def _render_lscl_membership_condition(
+    content: LsclIn | LsclNotIn,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL membership condition.
+
+    :param content: Condition to render.
+    :param options: Rendering options.
+    :param prefix: Prefix.
+    :return: Rendered condition.
+    """
+    return (
+        _render_lscl_rvalue(content.needle, options=options, prefix=prefix)
+        + _get_condition_operator(_BINARY_CONDITION_OPERATORS, content)
+        + _render_lscl_rvalue(content.haystack, options=options, prefix=prefix)
+    )
+
+
+def _render_lscl_comparison_condition(
+    content: (
+        LsclEqualTo
+        | LsclNotEqualTo
+        | LsclGreaterThan
+        | LsclGreaterThanOrEqualTo
+        | LsclLessThan
+        | LsclLessThanOrEqualTo
+    ),
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL comparison condition.
+
+    :param content: Condition to render.
+    :param options: Rendering options.
+    :param prefix: Prefix.
+    :return: Rendered condition.
+    """
+    return (
+        _render_lscl_rvalue(content.first, options=options, prefix=prefix)
+        + _get_condition_operator(_BINARY_CONDITION_OPERATORS, content)
+        + _render_lscl_rvalue(content.second, options=options, prefix=prefix)
+    )
+
+
+def _render_lscl_pattern_condition(
+    content: LsclMatch | LsclNotMatch,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+) -> str:
+    """Render an LSCL pattern matching condition.
+
+    :param content: Condition to render.
+    :param options: Rendering options.
+    :param prefix: Prefix.
+    :return: Rendered condition.
+    """
+    return (
+        _render_lscl_rvalue(content.value, options=options, prefix=prefix)
+        + _get_condition_operator(_BINARY_CONDITION_OPERATORS, content)
+        + _render_lscl_pattern(content.pattern, options=options)
+    )
+
+
+_CONDITION_RENDERERS: dict[type, Callable[..., str]] = {
+    LsclIn: _render_lscl_membership_condition,
+    LsclNotIn: _render_lscl_membership_condition,
+    LsclEqualTo: _render_lscl_comparison_condition,
+    LsclNotEqualTo: _render_lscl_comparison_condition,
+    LsclGreaterThanOrEqualTo: _render_lscl_comparison_condition,
+    LsclLessThanOrEqualTo: _render_lscl_comparison_condition,
+    LsclGreaterThan: _render_lscl_comparison_condition,
+    LsclLessThan: _render_lscl_comparison_condition,
+    LsclMatch: _render_lscl_pattern_condition,
+    LsclNotMatch: _render_lscl_pattern_condition,
+}
+"""Renderers for non-composite conditions, by exact type.
+
+Logical and negated conditions are walked by :py:func:`_render_lscl_condition`
+directly, conditions of subclasses of these types are rendered as their base
+type, and conditions of other types are rendered as right-values.
+"""
+
+_LOGICAL_CONDITION_TYPES: tuple[type, ...] = tuple(
+    _LOGICAL_CONDITION_OPERATORS,
+)
+"""Types of logical conditions."""
+
+_CONDITION_TYPES: dict[type, bool] = dict.fromkeys(
+    (*_LOGICAL_CONDITION_TYPES, LsclNot, *_CONDITION_RENDERERS),
+    True,
+)
+"""Types of conditions that are not right-values, by exact type.
+
+This is a table rather than a set, so that conditions of subclasses of
+these types can be recognized using :py:func:`lscl.utils._lookup_by_type`.
+"""
 
 
 def _render_lscl_condition(
@@ -442,148 +848,176 @@ def _render_lscl_condition(
     :param prefix: Prefix.
     :return: Rendered condition.
     """
-    if isinstance(content, (LsclAnd, LsclOr, LsclXor, LsclNand)):
-        if len(content.conditions) == 1:
-            return _render_lscl_condition(
-                content.conditions[0],
-                options=options,
-                prefix=prefix,
+    # NOTE: Logical and negated conditions are walked in post-order using
+    #   an explicit stack rather than recursively, so that deep boolean
+    #   trees neither hit the recursion limit nor pay for one call per
+    #   level. Each entry is a condition, and whether its operands have
+    #   already been rendered onto the result stack.
+    results: list[str] = []
+    stack: list[tuple[Any, bool]] = [(content, False)]
+    while stack:
+        cond, operands_rendered = stack.pop()
+
+        if isinstance(cond, _LOGICAL_CONDITION_TYPES):
+            operands = cond.conditions  # type: ignore
+            if len(operands) == 1:
+                stack.append((operands[0], False))
+            elif not operands_rendered:
+                stack.append((cond, True))
+                stack.extend((op, False) for op in reversed(operands))
+            else:
+                operator = _get_condition_operator(
+                    _LOGICAL_CONDITION_OPERATORS,
+                    cond,
+                )
+                start = len(results) - len(operands)
+                results[start:] = [
+                    operator.join(
+                        (
+                            f"({rendered})"
+                            if isinstance(op, _LOGICAL_CONDITION_TYPES)
+                            else rendered
+                        )
+                        for op, rendered in zip(operands, results[start:])
+                    ),
+                ]
+        elif isinstance(cond, LsclNot):
+            if isinstance(cond.condition, LsclSelector):
+                results.append(
+                    "!"
+                    + _render_lscl_selector(cond.condition, options=options),
+                )
+            elif not operands_rendered:
+                stack.append((cond, True))
+                stack.append((cond.condition, False))
+            else:
+                results[-1] = "!(" + results[-1] + ")"
+        else:
+            # Conditions of no other type are right-values.
+            renderer = (
+                _lookup_by_type(_CONDITION_RENDERERS, cond)
+                or _render_lscl_rvalue
             )
 
-        if isinstance(content, LsclAnd):
-            op = " and "
-        elif isinstance(content, LsclOr):
-            op = " or "
-        elif isinstance(content, LsclXor):
-            op = " xor "
-        else:
-            op = " nand "
+            results.append(renderer(cond, options=options, prefix=prefix))
 
-        rendered_conditions: list[str] = []
-        for cond in content.conditions:
-            rendered = _render_lscl_condition(
-                cond,
-                options=options,
-                prefix=prefix,
-            )
-            if isinstance(cond, (LsclAnd, LsclOr, LsclXor, LsclNand)):
-                rendered = f"({rendered})"
+    return results[0]
 
-            rendered_conditions.append(rendered)
 
-        result = op.join(rendered_conditions)
-    elif isinstance(content, LsclNot):
-        if isinstance(content.condition, LsclSelector):
-            result = "!" + _render_lscl_selector(
-                content.condition,
-                options=options,
-            )
-        else:
-            result = (
-                "!("
-                + _render_lscl_condition(
-                    content.condition,
-                    options=options,
-                    prefix=prefix,
-                )
-                + ")"
-            )
-    elif isinstance(content, LsclIn):
-        result = (
-            _render_lscl_rvalue(content.needle, options=options, prefix=prefix)
-            + " in "
-            + _render_lscl_rvalue(
-                content.haystack,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclNotIn):
-        result = (
-            _render_lscl_rvalue(content.needle, options=options, prefix=prefix)
-            + " not in "
-            + _render_lscl_rvalue(
-                content.haystack,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclEqualTo):
-        result = (
-            _render_lscl_rvalue(content.first, options=options, prefix=prefix)
-            + " == "
-            + _render_lscl_rvalue(
-                content.second,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclNotEqualTo):
-        result = (
-            _render_lscl_rvalue(content.first, options=options, prefix=prefix)
-            + " != "
-            + _render_lscl_rvalue(
-                content.second,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclGreaterThanOrEqualTo):
-        result = (
-            _render_lscl_rvalue(content.first, options=options, prefix=prefix)
-            + " >= "
-            + _render_lscl_rvalue(
-                content.second,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclLessThanOrEqualTo):
-        result = (
-            _render_lscl_rvalue(content.first, options=options, prefix=prefix)
-            + " <= "
-            + _render_lscl_rvalue(
-                content.second,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclGreaterThan):
-        result = (
-            _render_lscl_rvalue(content.first, options=options, prefix=prefix)
-            + " > "
-            + _render_lscl_rvalue(
-                content.second,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclLessThan):
-        result = (
-            _render_lscl_rvalue(content.first, options=options, prefix=prefix)
-            + " < "
-            + _render_lscl_rvalue(
-                content.second,
-                options=options,
-                prefix=prefix,
-            )
-        )
-    elif isinstance(content, LsclMatch):
-        result = (
-            _render_lscl_rvalue(content.value, options=options, prefix=prefix)
-            + " =~ "
-            + _render_lscl_pattern(content.pattern, options=options)
-        )
-    elif isinstance(content, LsclNotMatch):
-        result = (
-            _render_lscl_rvalue(content.value, options=options, prefix=prefix)
-            + " !~ "
-            + _render_lscl_pattern(content.pattern, options=options)
+def _render_lscl_block(
+    element: LsclBlock,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+    write: Callable[[str], object],
+) -> list[str | LsclContent] | None:
+    """Render an LSCL block.
+
+    :param element: Block to render.
+    :param options: Rendering options, unused here.
+    :param prefix: Prefix to render with.
+    :param write: Function to call with every rendered fragment.
+    :return: Content to render within the block, and closing fragment.
+    """
+    if not element.content:
+        write(f"{prefix}{element.name} {'{}'}\n")
+        return None
+
+    write(f"{prefix}{element.name} {'{'}\n")
+    return [element.content, prefix + "}\n"]
+
+
+def _render_lscl_attribute(
+    element: LsclAttribute,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+    write: Callable[[str], object],
+) -> list[str | LsclContent] | None:
+    """Render an LSCL attribute.
+
+    :param element: Attribute to render.
+    :param options: Rendering options.
+    :param prefix: Prefix to render with.
+    :param write: Function to call with every rendered fragment.
+    :return: Nothing, since attributes contain no content.
+    """
+    write(f"{prefix}{element.name} => ")
+    _render_lscl_data(
+        element.content,
+        options=options,
+        prefix=prefix,
+        write=write,
+    )
+    return None
+
+
+def _render_lscl_conditions(
+    element: LsclConditions,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    prefix: str,
+    write: Callable[[str], object],
+) -> list[str | LsclContent] | None:
+    """Render LSCL conditions.
+
+    :param element: Conditions to render.
+    :param options: Rendering options.
+    :param prefix: Prefix to render with.
+    :param write: Function to call with every rendered fragment, unused
+        here.
+    :return: Fragments and branch contents to render, in order.
+    """
+    parts: list[str | LsclContent] = []
+    add_part = parts.append
+    branch_end = prefix + "}"
+    before_cond = prefix
+
+    for cond, body in element.conditions:
+        rendered = _render_lscl_condition(
+            cond,
+            options=options,
+            prefix=prefix,
         )
-    else:
-        result = _render_lscl_rvalue(content, options=options, prefix=prefix)
 
-    return result
+        if body:
+            add_part(f"{before_cond}if {rendered} {'{'}\n")
+            add_part(body)
+            add_part(branch_end)
+            before_cond = " else "
+        else:
+            add_part(f"{before_cond}if {rendered} {'{}'}")
+            before_cond = f"\n{prefix}else "
+
+    if element.default is not None:
+        if element.default:
+            add_part(before_cond + "{\n")
+            add_part(element.default)
+            add_part(branch_end)
+        else:
+            add_part(before_cond + "{}")
+
+    add_part("\n")
+    return parts
+
+
+_CONTENT_RENDERERS: dict[
+    type,
+    Callable[..., list[str | LsclContent] | None],
+] = {
+    LsclAttribute: _render_lscl_attribute,
+    LsclBlock: _render_lscl_block,
+    LsclConditions: _render_lscl_conditions,
+}
+"""Renderers for content elements, by exact type.
+
+Elements of subclasses of these types are looked up in order. Renderers
+return the fragments and nested contents that remain to be rendered after
+what they have written, in order, if any.
+"""
 
 
 def _render_lscl_content(
@@ -592,82 +1026,126 @@ def _render_lscl_content(
     *,
     options: _LsclRenderingOptions,
     prefix: str,
-) -> str:
+    write: Callable[[str], object],
+) -> None:
     """Render LSCL content.
 
+    Nested contents are walked using an explicit stack rather than
+    recursion, so that deeply nested content does not hit the recursion
+    limit.
+
     :param content: Content to render.
     :param options: Rendering options.
     :param prefix: Prefix to render with.
-    :return: Rendered content.
+    :param write: Function to call with every rendered fragment.
     """
-    rendered = ""
-    for element in content:
-        if isinstance(element, LsclBlock):
-            if element.content:
-                rendered += (
-                    f"{prefix}{element.name} {'{'}\n"
-                    + _render_lscl_content(
-                        element.content,
-                        options=options,
-                        prefix=prefix + "  ",
+    # NOTE: Each entry of the stack is either a fragment to write, or an
+    #   iterator over the remaining elements of a content with the prefix
+    #   to render them with. When an element has nested contents, the
+    #   iterator is put back on the stack below the element's remaining
+    #   parts, so that the following elements are rendered afterwards.
+    stack: list[str | tuple[Iterator[Any], str]] = [(iter(content), prefix)]
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            write(entry)
+            continue
+
+        elements, element_prefix = entry
+        for element in elements:
+            renderer = _lookup_by_type(_CONTENT_RENDERERS, element)
+            if renderer is None:
+                raise TypeError(f"Unable to render {type(element)} into LSCL.")
+
+            parts = renderer(
+                element,
+                options=options,
+                prefix=element_prefix,
+                write=write,
+            )
+            if parts:
+                child_prefix = element_prefix + "  "
+                stack.append(entry)
+                stack.extend(
+                    (
+                        part
+                        if isinstance(part, str)
+                        else (iter(part), child_prefix)
                     )
-                    + f"{prefix}{'}'}\n"
+                    for part in reversed(parts)
                 )
-            else:
-                rendered += f"{prefix}{element.name} {'{}'}\n"
-        elif isinstance(element, LsclAttribute):
-            rendered += f"{prefix}{element.name} => " + _render_lscl_data(
-                element.content,
+                break
+
+
+def _render_lscl(
+    content: LsclRenderable,
+    /,
+    *,
+    options: _LsclRenderingOptions,
+    write: Callable[[str], object],
+) -> None:
+    """Render content as LSCL.
+
+    :param content: Content to render as LSCL.
+    :param options: Rendering options.
+    :param write: Function to call with every rendered fragment.
+    """
+    if isinstance(content, (str, bool, int, float, Decimal, LsclLiteral)):
+        _render_lscl_data(content, options=options, prefix="", write=write)
+        return
+
+    if isinstance(content, (LsclSelector, LsclMethodCall)):
+        write(_render_lscl_rvalue(content, options=options, prefix=""))
+        return
+
+    if _lookup_by_type(_CONDITION_TYPES, content):
+        write(
+            _render_lscl_condition(
+                content,  # type: ignore
                 options=options,
-                prefix=prefix,
-            )
-        else:
-            before_cond = prefix
+                prefix="",
+            ),
+        )
+        return
 
-            for cond, body in element.conditions:
-                rendered += f"{before_cond}if " + _render_lscl_condition(
-                    cond,
-                    options=options,
-                    prefix=prefix,
-                )
+    if isinstance(content, _CONTENT_TYPES):
+        _render_lscl_content(
+            [content],
+            options=options,
+            prefix="",
+            write=write,
+        )
+        return
 
-                if body:
-                    rendered += (
-                        " {\n"
-                        + _render_lscl_content(
-                            body,
-                            options=options,
-                            prefix=prefix + "  ",
-                        )
-                        + prefix
-                        + "}"
-                    )
-                    before_cond = " else "
-                else:
-                    rendered += " {}"
-                    before_cond = f"\n{prefix}else "
-
-            if element.default is not None:
-                if element.default:
-                    rendered += (
-                        before_cond
-                        + "{\n"
-                        + _render_lscl_content(
-                            element.default,
-                            options=options,
-                            prefix=prefix + "  ",
-                        )
-                        + prefix
-                        + "}"
-                    )
-                else:
-                    rendered += before_cond + "{}"
+    if isinstance(content, dict):
+        _render_lscl_data(content, options=options, prefix="", write=write)
+        return
+
+    if not isinstance(content, list):
+        raise TypeError(f"Unable to render {type(content)} into LSCL.")
+
+    # NOTE: Lists of blocks, attributes and conditions are rendered as
+    #       content, and other lists are rendered as data. Data elements are
+    #       checked while being rendered; an empty list is considered to be
+    #       empty content.
+    if all(isinstance(element, _CONTENT_TYPES) for element in content):
+        _render_lscl_content(
+            content,  # type: ignore
+            options=options,
+            prefix="",
+            write=write,
+        )
+        return
 
-            rendered += "\n"
+    if any(isinstance(element, _CONTENT_TYPES) for element in content):
+        raise TypeError(
+            "Unable to render a list mixing content and data into LSCL.",
+        )
 
-    return rendered
+    _render_lscl_data(content, options=options, prefix="", write=write)
 
 
+@overload
 def render_as_lscl(
     content: LsclRenderable,
     /,
@@ -678,7 +1156,37 @@ def render_as_lscl(
         "ampersand",
         "none",
     ] = "none",
-) -> str:
+    out: None = None,
+) -> str: ...
+
+
+@overload
+def render_as_lscl(
+    content: LsclRenderable,
+    /,
+    *,
+    escapes_supported: bool = False,
+    field_reference_escape_style: Literal[
+        "percent",
+        "ampersand",
+        "none",
+    ] = "none",
+    out: TextIO,
+) -> None: ...
+
+
+def render_as_lscl(
+    content: LsclRenderable,
+    /,
+    *,
+    escapes_supported: bool = False,
+    field_reference_escape_style: Literal[
+        "percent",
+        "ampersand",
+        "none",
+    ] = "none",
+    out: TextIO | None = None,
+) -> str | None:
     """Render content as LSCL.
 
     :param content: Content to render as LSCL.
@@ -687,59 +1195,30 @@ def render_as_lscl(
     :param field_reference_escape_style: The
         ``config.field_reference.escape_style`` value in the configuration
         of the target environment.
-    :return: Rendered content.
+    :param out: Stream to write the rendered content to, if the rendered
+        content should not be returned.
+    :return: Rendered content, or None if written to the provided stream.
     :raises StringRenderingError: A string could not be rendered due to
         invalid characters being present.
     :raises SelectorElementRenderingError: A selector could not be rendered
         due to invalid characters being in one of its elements.
+    :raises TypeError: The content, or part of it, cannot be rendered.
     """
+    if field_reference_escape_style not in _FIELD_REFERENCE_ESCAPE_STYLES:
+        raise ValueError(
+            "Unsupported field reference escape style: "
+            + repr(field_reference_escape_style),
+        )
+
     options = _LsclRenderingOptions(
         escapes_supported=escapes_supported,
         field_reference_escape_style=field_reference_escape_style,
     )
 
-    if isinstance(content, (str, bool, int, float, Decimal, LsclLiteral)):
-        return _render_lscl_data(content, options=options, prefix="")
-
-    if isinstance(content, (LsclSelector, LsclMethodCall)):
-        return _render_lscl_rvalue(content, options=options, prefix="")
-
-    if isinstance(
-        content,
-        (
-            LsclAnd,
-            LsclNand,
-            LsclOr,
-            LsclXor,
-            LsclNot,
-            LsclIn,
-            LsclNotIn,
-            LsclEqualTo,
-            LsclNotEqualTo,
-            LsclGreaterThan,
-            LsclGreaterThanOrEqualTo,
-            LsclLessThan,
-            LsclLessThanOrEqualTo,
-            LsclMatch,
-            LsclNotMatch,
-        ),
-    ):
-        return _render_lscl_condition(content, options=options, prefix="")
-
-    if isinstance(content, (LsclBlock, LsclAttribute, LsclConditions)):
-        return _render_lscl_content([content], options=options, prefix="")
-
-    # We can either have an LsclContent, an list[LsclData], or something
-    # else we don't manage here, e.g. some weird mix of both.
-    # We want to use pydantic to determine which it is.
-    try:
-        result = _lscl_list_type_adapter.validate_python({"value": content})
-    except ValueError as exc:
-        raise TypeError(
-            f"Unable to render {type(content)} into LSCL.",
-        ) from exc
-
-    if isinstance(result, _LsclContentMatcher):
-        return _render_lscl_content(result.value, options=options, prefix="")
+    if out is not None:
+        _render_lscl(content, options=options, write=out.write)
+        return None
 
-    return _render_lscl_data(result.value, options=options, prefix="")
+    fragments: list[str] = []
+    _render_lscl(content, options=options, write=fragments.append)
+    return "".join(fragments)
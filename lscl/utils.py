@@ -30,11 +30,15 @@
 
 from __future__ import annotations
 
+from typing import Any, TypeVar
+
 from pydantic import BaseModel
 
 
 __all__ = ["Runk"]
 
+_T = TypeVar("_T")
+
 
 class Runk(BaseModel):
     """Ronald's universal number kounter.
@@ -56,11 +60,48 @@ class Runk(BaseModel):
 
         :param raw: Raw string to take into account.
         """
-        self.offset += len(raw)
-        try:
-            newline_offset = raw.rindex("\n")
-        except ValueError:
-            self.column += len(raw)
+        self.count_range(raw, 0, len(raw))
+
+    def count_range(self, raw: str, start: int, end: int, /) -> None:
+        """Add a range of a string to the count.
+
+        This is equivalent to ``count(raw[start:end])``, without building
+        the substring.
+
+        :param raw: Raw string in which the range is defined.
+        :param start: Offset of the start of the range in the string.
+        :param end: Offset of the end of the range in the string.
+        """
+        self.offset += end - start
+        newline_offset = raw.rfind("\n", start, end)
+        if newline_offset < 0:
+            self.column += end - start
         else:
-            self.line += raw.count("\n")
-            self.column = len(raw) - newline_offset
+            self.line += raw.count("\n", start, end)
+            self.column = end - newline_offset
+
+
+def _lookup_by_type(table: dict[type, _T], value: Any, /) -> _T | None:
+    """Look up the entry for a value in a table keyed by type.
+
+    The exact type of the value is looked up first. If it is missing, the
+    table is scanned in order for a type the value is an instance of, so
+    that values of subclasses of the types in the table get the entry for
+    their base type.
+
+    :param table: Table to look up the entry in, by exact type.
+    :param value: Value to look up the entry for.
+    :return: Found entry, or None if the value is of no type in the table.
+    """
+    entry = table.get(type(value))
+    if entry is None:
+        entry = next(
+            (
+                entry
+                for entry_type, entry in table.items()
+                if isinstance(value, entry_type)
+            ),
+            None,
+        )
+
+    return entry
@@ -39,6 +39,8 @@ from lscl.filters import (
 from lscl.lang import (
     LsclAttribute,
     LsclBlock,
+    LsclConditions,
+    LsclContent,
     LsclEqualTo,
     LsclGreaterThan,
     LsclSelector,
@@ -110,6 +112,72 @@ def test_find_filter_on_block() -> None:
     assert parse_logstash_filters(block.content, at_root=True) == expected
 
 
+def test_find_filters_in_empty_filter_block() -> None:
+    """Check that an empty "filter" block does not trigger the fallback."""
+    assert parse_logstash_filters("filter {}\nmutate {}\n") == []
+    assert parse_logstash_filters("mutate {}\n") == [
+        LogstashFilter(name="mutate"),
+    ]
+
+
+def test_find_filters_behind_conditions_without_filter_block() -> None:
+    """Check that conditions without "filter" blocks trigger the fallback."""
+    assert parse_logstash_filters("if [a] { mutate {} }") == [
+        LogstashFilterBranching(
+            conditions=[
+                (LsclSelector(names=["a"]), [LogstashFilter(name="mutate")]),
+            ],
+        ),
+    ]
+    assert parse_logstash_filters("if [a] { mutate {} }", at_root=False) == [
+        LogstashFilterBranching(conditions=[(LsclSelector(names=["a"]), [])]),
+    ]
+
+
+class _Block(LsclBlock):
+    """Block subclass, for finding filters in subclasses."""
+
+
+class _Attribute(LsclAttribute):
+    """Attribute subclass, for finding filters in subclasses."""
+
+
+class _Conditions(LsclConditions):
+    """Conditions subclass, for finding filters in subclasses."""
+
+
+def test_find_filters_in_content_subclasses() -> None:
+    """Check that subclasses of content types are handled as such."""
+    assert parse_logstash_filters([_Block(name="mutate")], at_root=True) == [
+        LogstashFilter(name="mutate"),
+    ]
+    assert parse_logstash_filters(
+        [_Block(name="mutate", content=[_Attribute(name="a", content=1)])],
+        at_root=True,
+    ) == [LogstashFilter(name="mutate", config={"a": 1})]
+    assert parse_logstash_filters(
+        [_Block(name="filter", content=[_Block(name="mutate")])],
+    ) == [LogstashFilter(name="mutate")]
+    assert parse_logstash_filters(
+        [
+            _Conditions(
+                conditions=[
+                    (
+                        LsclSelector(names=["a"]),
+                        [_Block(name="filter", content=[_Block(name="b")])],
+                    ),
+                ],
+            ),
+        ],
+    ) == [
+        LogstashFilterBranching(
+            conditions=[
+                (LsclSelector(names=["a"]), [LogstashFilter(name="b")]),
+            ],
+        ),
+    ]
+
+
 def test_render_filters() -> None:
     """Check that filter rendering works correctly."""
     assert (
@@ -148,3 +216,77 @@ def test_render_filters() -> None:
         == "if [power] > 9000 {\n  mutate {\n    convert => {\n      power => "
         + "string\n    }\n  }\n} else {\n  age {}\n}\n"
     )
+
+
+def test_find_filter_with_default() -> None:
+    """Check that default branches are explored as well."""
+    raw = """
+    if [a] == 1 {
+        filter {
+            age {}
+        }
+    } else {
+        filter {
+            mutate {}
+        }
+    }
+    """
+
+    assert parse_logstash_filters(raw) == [
+        LogstashFilterBranching(
+            conditions=[
+                (
+                    LsclEqualTo(first=LsclSelector(names=["a"]), second=1),
+                    [LogstashFilter(name="age")],
+                ),
+            ],
+            default=[LogstashFilter(name="mutate")],
+        ),
+    ]
+
+
+def test_find_deeply_nested_filters() -> None:
+    """Check that deeply nested conditions do not exhaust the stack."""
+    depth = 5000
+    condition = LsclSelector(names=["x"])
+    content: LsclContent = [LsclBlock(name="age")]
+    for _ in range(depth):
+        content = [
+            LsclConditions(conditions=[(condition, content)], default=[]),
+        ]
+
+    filters = parse_logstash_filters(content, at_root=True)
+    for _ in range(depth):
+        (branching,) = filters
+        assert isinstance(branching, LogstashFilterBranching)
+        assert branching.default is None
+        ((_, filters),) = branching.conditions
+
+    assert filters == [LogstashFilter(name="age")]
+
+
+def test_render_deeply_nested_filters() -> None:
+    """Check that deeply nested branching can be rendered."""
+    depth = 5000
+    condition = LsclSelector(names=["x"])
+    filters: list = [LogstashFilter(name="age")]
+    for _ in range(depth):
+        filters = [LogstashFilterBranching(conditions=[(condition, filters)])]
+
+    rendered = render_logstash_filters(filters)
+    assert rendered.startswith("if [x] {\n  if [x] {\n")
+    assert " " * (2 * depth) + "age {}\n" in rendered
+    assert rendered.endswith("  }\n}\n")
+
+
+def test_render_filters_without_sorting_keys() -> None:
+    """Check that filter configuration keys can be rendered in order."""
+    filters = [LogstashFilter(name="mutate", config={"b": 1, "a": 2})]
+
+    assert (
+        render_logstash_filters(filters) == "mutate {\n  a => 2\n  b => 1\n}\n"
+    )
+    assert (
+        render_logstash_filters(filters, sort_keys=False)
+        == "mutate {\n  b => 1\n  a => 2\n}\n"
+    )
@@ -30,10 +30,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from copy import copy
 from decimal import Decimal
-from itertools import zip_longest
+from functools import lru_cache
 from pathlib import Path
+import pickle
+import sys
 
+from pydantic import ValidationError
 import pytest
 
 from lscl.errors import DecodeError
@@ -66,6 +71,7 @@ from lscl.parser import (
     LsclStringToken,
     LsclToken,
     LsclTokenType,
+    UnexpectedLsclToken,
     parse_lscl,
     parse_lscl_tokens,
 )
@@ -74,6 +80,58 @@ from lscl.parser import (
 CONFIGS_PATH = Path(__file__).parent / "configs"
 
 
+@lru_cache(maxsize=None)
+def _read_config(path: str, /) -> str:
+    """Read a configuration file from the test configurations directory.
+
+    This is cached since the same files are used by multiple tests.
+
+    :param path: Path to the file, relative to the configurations directory.
+    :return: Contents of the file.
+    """
+    return (CONFIGS_PATH / path).read_text()
+
+
+def _tokens_match(expected: LsclToken, obtained: LsclToken, /) -> bool:
+    """Check whether an obtained token matches an expected token.
+
+    Positions of the tokens are not compared.
+
+    :param expected: Expected token.
+    :param obtained: Obtained token.
+    :return: Whether the tokens match.
+    """
+    return (
+        type(obtained) is type(expected)
+        and obtained.type == expected.type
+        and getattr(obtained, "value", None)
+        == getattr(expected, "value", None)
+        and getattr(obtained, "raw", None) == getattr(expected, "raw", None)
+    )
+
+
+def _assert_lexed_tokens(raw: str, tokens: Iterable[LsclToken], /) -> None:
+    """Check that lexing a string produces the expected tokens.
+
+    An end token is expected after the provided tokens.
+
+    :param raw: String to lex.
+    :param tokens: Expected tokens, without the end token.
+    """
+    expected_tokens = [*tokens, LsclSimpleToken(type=LsclTokenType.END)]
+    obtained_tokens = list(parse_lscl_tokens(raw))
+
+    for i, (obtained_token, expected_token) in enumerate(
+        zip(obtained_tokens, expected_tokens),
+    ):
+        assert _tokens_match(expected_token, obtained_token), (
+            f"At index {i}, obtained {obtained_token} does not match "
+            + f"expected {expected_token}"
+        )
+
+    assert len(obtained_tokens) == len(expected_tokens)
+
+
 @pytest.mark.parametrize(
     "raw,tokens",
     (
@@ -88,6 +146,14 @@ CONFIGS_PATH = Path(__file__).parent / "configs"
                 LsclSimpleToken(type=LsclTokenType.RBRACE),
             ],
         ),
+        (
+            '"a\\"b\\\nc" \'d\\\' /e\\/f\\/',
+            [
+                LsclStringToken(type=LsclTokenType.DQUOT, value='a\\"b\\\nc'),
+                LsclStringToken(type=LsclTokenType.SQUOT, value="d\\"),
+                LsclStringToken(type=LsclTokenType.PATTERN, value="e\\/f\\"),
+            ],
+        ),
         (
             "if hello('world', [a], 5) == 0 {}",
             [
@@ -113,25 +179,7 @@ CONFIGS_PATH = Path(__file__).parent / "configs"
 )
 def test_lex(raw: str, tokens: LsclToken) -> None:
     """Test the lexer."""
-    for i, (obtained_token, expected_token) in enumerate(
-        zip_longest(
-            parse_lscl_tokens(raw),
-            [*tokens, LsclSimpleToken(type=LsclTokenType.END)],
-        ),
-    ):
-        # Update the obtained token for comparison.
-        expected_token = expected_token.model_copy(
-            update={
-                "line": obtained_token.line,
-                "column": obtained_token.column,
-                "offset": obtained_token.offset,
-            },
-        )
-
-        assert expected_token == obtained_token, (
-            f"At index {i}, obtained {obtained_token} does not match "
-            + f"expected {expected_token}"
-        )
+    _assert_lexed_tokens(raw, tokens)
 
 
 @pytest.mark.parametrize(
@@ -338,31 +386,21 @@ def test_lex(raw: str, tokens: LsclToken) -> None:
 )
 def test_lex_file(path: str, tokens: LsclToken) -> None:
     """Test the lexer."""
-    with open(CONFIGS_PATH / path) as fp:
-        raw = fp.read()
-
-    for i, (obtained_token, expected_token) in enumerate(
-        zip_longest(
-            parse_lscl_tokens(raw),
-            [*tokens, LsclSimpleToken(type=LsclTokenType.END)],
-        ),
-    ):
-        # Update the obtained token for comparison.
-        expected_token = expected_token.model_copy(
-            update={
-                "line": obtained_token.line,
-                "column": obtained_token.column,
-                "offset": obtained_token.offset,
-            },
-        )
-
-        assert expected_token == obtained_token, (
-            f"At index {i}, obtained {obtained_token} does not match "
-            + f"expected {expected_token}"
-        )
+    _assert_lexed_tokens(_read_config(path), tokens)
 
 
-@pytest.mark.parametrize("raw", ("@" + "." * 30, "'"))
+@pytest.mark.parametrize(
+    "raw",
+    (
+        "@" + "." * 30,
+        "'",
+        # NOTE: Large invalid inputs, to guard against lexing patterns
+        #       backtracking on unterminated tokens.
+        "@" + "." * 100_000,
+        '"' + "\\a" * 50_000,
+        "'" + "a" * 100_000,
+    ),
+)
 def test_lex_invalid(raw: str) -> None:
     """Check that invalid tokens are correctly detected."""
     with pytest.raises(DecodeError):
@@ -370,6 +408,26 @@ def test_lex_invalid(raw: str) -> None:
             pass
 
 
+def test_lex_invalid_message() -> None:
+    """Check that the decoding error message is formatted correctly."""
+    with pytest.raises(DecodeError) as exc_info:
+        for _ in parse_lscl_tokens("a {\n  @"):
+            pass
+
+    assert (exc_info.value.line, exc_info.value.column) == (2, 3)
+    assert str(exc_info.value) == (
+        "At line 2, column 3: could not parse configuration starting "
+        + "from: @"
+    )
+
+    for copied in (
+        copy(exc_info.value),
+        pickle.loads(pickle.dumps(exc_info.value)),
+    ):
+        assert (copied.line, copied.column) == (2, 3)
+        assert str(copied) == str(exc_info.value)
+
+
 @pytest.mark.parametrize(
     "raw,content",
     (
@@ -569,6 +627,53 @@ def test_parse(raw: str, content: LsclContent) -> None:
     assert parse_lscl(raw) == content
 
 
+def test_parse_interns_names() -> None:
+    """Check that repeated names share the same string object."""
+    content = parse_lscl(
+        "mutate { add_field => 1 }\n"
+        + "mutate { add_field => 2 }\n"
+        + "if [a][b] and [a][b] {}\n",
+    )
+    assert isinstance(content[0], LsclBlock)
+    assert isinstance(content[1], LsclBlock)
+    assert content[0].name is content[1].name
+
+    first_attr, second_attr = content[0].content[0], content[1].content[0]
+    assert isinstance(first_attr, LsclAttribute)
+    assert isinstance(second_attr, LsclAttribute)
+    assert first_attr.name is second_attr.name
+
+    cond = content[2]
+    assert isinstance(cond, LsclConditions)
+    and_cond = cond.conditions[0][0]
+    assert isinstance(and_cond, LsclAnd)
+    first_sel, second_sel = and_cond.conditions
+    assert isinstance(first_sel, LsclSelector)
+    assert isinstance(second_sel, LsclSelector)
+    assert all(
+        first is second
+        for first, second in zip(first_sel.names, second_sel.names)
+    )
+
+
+def test_parse_deeply_nested_blocks() -> None:
+    """Check that nesting blocks is not limited by the recursion limit."""
+    depth = sys.getrecursionlimit() * 2
+    content = parse_lscl("if [x] { a { " * depth + "} }" * depth)
+
+    for _ in range(depth):
+        assert len(content) == 1
+        cond = content[0]
+        assert isinstance(cond, LsclConditions)
+        assert len(cond.conditions[0][1]) == 1
+        block = cond.conditions[0][1][0]
+        assert isinstance(block, LsclBlock)
+        assert block.name == "a"
+        content = block.content
+
+    assert content == []
+
+
 def test_parse_with_percent_field_reference_encoding() -> None:
     """Check that parsing with percent field reference encoding works."""
     assert parse_lscl(
@@ -893,8 +998,7 @@ def test_parse_with_ampersand_field_reference_encoding() -> None:
 )
 def test_parse_file(path: str, content: LsclContent) -> None:
     """Test that parsing works correctly."""
-    with open(CONFIGS_PATH / path) as fp:
-        raw = fp.read()
+    raw = _read_config(path)
 
     assert parse_lscl(raw, support_escapes=True) == content
 
@@ -968,3 +1072,55 @@ def test_parse_invalid(raw: str) -> None:
     """Check that invalid syntax are detected correctly."""
     with pytest.raises(DecodeError):
         parse_lscl(raw)
+
+
+def test_parse_invalid_message() -> None:
+    """Check that the unexpected token error message is formatted correctly."""
+    with pytest.raises(UnexpectedLsclToken) as exc_info:
+        parse_lscl("a { } }")
+
+    assert exc_info.value.token.type == LsclTokenType.RBRACE
+    assert (exc_info.value.line, exc_info.value.column) == (1, 7)
+    assert (
+        str(exc_info.value) == "At line 1, column 7: unexpected token RBRACE"
+    )
+
+    for copied in (
+        copy(exc_info.value),
+        pickle.loads(pickle.dumps(exc_info.value)),
+    ):
+        assert copied.token == exc_info.value.token
+        assert (copied.line, copied.column) == (1, 7)
+        assert str(copied) == str(exc_info.value)
+
+
+def test_parse_lexing_error_before_syntax_error() -> None:
+    """Check that lexing errors are reported over earlier syntax errors."""
+    with pytest.raises(DecodeError) as exc_info:
+        parse_lscl("not%if")
+
+    assert not isinstance(exc_info.value, UnexpectedLsclToken)
+    assert (exc_info.value.line, exc_info.value.column) == (1, 4)
+
+
+def test_parse_invalid_selector_list() -> None:
+    """Check that lists matched as selectors are lexed entirely."""
+    with pytest.raises(DecodeError) as exc_info:
+        parse_lscl("a => [hello @]")
+
+    assert (exc_info.value.line, exc_info.value.column) == (1, 13)
+
+
+@pytest.mark.parametrize(
+    "raw,pattern",
+    (("if [x] =~ '(' {}", "("), ("if [x] !~ /[/ {}", "[")),
+)
+def test_parse_invalid_pattern(raw: str, pattern: str) -> None:
+    """Check that invalid patterns are detected correctly."""
+    with pytest.raises(ValidationError) as exc_info:
+        parse_lscl(raw)
+
+    (error,) = exc_info.value.errors()
+    assert error["loc"] == ("pattern",)
+    assert error["type"] == "pattern_regex"
+    assert error["input"] == pattern
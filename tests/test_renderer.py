@@ -30,6 +30,11 @@
 
 from __future__ import annotations
 
+from copy import copy
+from io import StringIO
+import pickle
+import sys
+
 import pytest
 
 from lscl.errors import SelectorElementRenderingError, StringRenderingError
@@ -224,6 +229,7 @@ from lscl.renderer import LsclRenderable, render_as_lscl
             LsclLiteral(content="WHATEVER I 'WANT' }"),
             "WHATEVER I 'WANT' }\n",
         ),
+        ([], ""),
         (
             [LsclLiteral(content="[1, 2]"), 3],
             "[\n  [1, 2],\n  3\n]\n",
@@ -305,6 +311,17 @@ def test_render_unrenderable_string_without_escapes(
         render_as_lscl(raw, escapes_supported=False)
 
     assert exc_info.value.string == raw
+    assert str(exc_info.value) == (
+        f"The following string could not be rendered: {raw!r}"
+    )
+    assert exc_info.value.args == (raw,)
+
+    for copied in (
+        copy(exc_info.value),
+        pickle.loads(pickle.dumps(exc_info.value)),
+    ):
+        assert copied.string == raw
+        assert str(copied) == str(exc_info.value)
 
 
 @pytest.mark.parametrize(
@@ -347,9 +364,187 @@ def test_render_unrenderable_selector_without_escapes(
         render_as_lscl(raw, field_reference_escape_style="none")
 
     assert exc_info.value.selector_element == selector_element
+    assert str(exc_info.value) == (
+        f"The following selector could not be rendered: {selector_element!r}"
+    )
+    assert exc_info.value.args == (selector_element,)
+
+    for copied in (
+        copy(exc_info.value),
+        pickle.loads(pickle.dumps(exc_info.value)),
+    ):
+        assert copied.selector_element == selector_element
+        assert str(copied) == str(exc_info.value)
+
+
+class _Number(int):
+    """Integer subclass, for rendering subclasses of scalar types."""
+
+
+class _Selector(LsclSelector):
+    """Selector subclass, for rendering subclasses of right-value types."""
+
+
+def test_render_scalar_subclass() -> None:
+    """Check that subclasses of scalar types are rendered as such."""
+    assert render_as_lscl([_Number(3), True]) == "[\n  3,\n  true\n]\n"
+
+    # NOTE: Validation converts integer subclasses to integers, hence the
+    #       model being built without validation here.
+    assert (
+        render_as_lscl(LsclEqualTo.model_construct(first=_Number(3), second=4))
+        == "3 == 4"
+    )
+    assert (
+        render_as_lscl(
+            LsclNot(
+                condition=LsclIn(
+                    needle=_Number(3),
+                    haystack=_Selector(names=["a"]),
+                ),
+            ),
+        )
+        == "!(3 in [a])"
+    )
+
+
+class _Block(LsclBlock):
+    """Block subclass, for rendering subclasses of content types."""
+
+
+class _EqualTo(LsclEqualTo):
+    """Condition subclass, for rendering subclasses of condition types."""
+
+
+class _And(LsclAnd):
+    """Logical condition subclass, for rendering subclasses of such types."""
+
+
+def test_render_content_subclass() -> None:
+    """Check that subclasses of content types are rendered as such."""
+    assert (
+        render_as_lscl([_Block(name="mutate", content=[_Block(name="a")])])
+        == "mutate {\n  a {}\n}\n"
+    )
+    assert (
+        render_as_lscl(
+            [
+                LsclConditions(
+                    conditions=[
+                        (
+                            LsclNot(condition=_EqualTo(first=1, second=2)),
+                            [_Block(name="a")],
+                        ),
+                    ],
+                ),
+            ],
+        )
+        == "if !(1 == 2) {\n  a {}\n}\n"
+    )
+
+
+def test_render_condition_subclass() -> None:
+    """Check that subclasses of condition types are rendered as such."""
+    assert render_as_lscl(_EqualTo(first=1, second=2)) == "1 == 2"
+    assert (
+        render_as_lscl(
+            LsclOr(
+                conditions=[
+                    _And(
+                        conditions=[
+                            LsclSelector(names=["a"]),
+                            LsclSelector(names=["b"]),
+                        ],
+                    ),
+                    LsclSelector(names=["c"]),
+                ],
+            ),
+        )
+        == "([a] and [b]) or [c]"
+    )
+
+
+def test_render_to_stream() -> None:
+    """Check that content can be rendered to a stream."""
+    content = [
+        LsclBlock(
+            name="mutate",
+            content=[LsclAttribute(name="add_tag", content=["a", "b"])],
+        ),
+    ]
+
+    stream = StringIO()
+    assert render_as_lscl(content, out=stream) is None
+    assert stream.getvalue() == render_as_lscl(content)
+    assert stream.getvalue() == (
+        'mutate {\n  add_tag => [\n    "a",\n    "b"\n  ]\n}\n'
+    )
+
+
+def test_render_deeply_nested_conditions() -> None:
+    """Check that nesting conditions is not limited by the recursion limit."""
+    depth = sys.getrecursionlimit() * 2
+    cond = LsclEqualTo(first=LsclSelector(names=["x"]), second=1)
+    for _ in range(depth):
+        # NOTE: Validation is recursive, hence the models being built
+        #       without validation here.
+        cond = LsclNot.model_construct(
+            condition=LsclAnd.model_construct(
+                conditions=[LsclSelector(names=["y"]), cond],
+            ),
+        )
+
+    assert render_as_lscl(cond) == (
+        "!([y] and " * depth + "[x] == 1" + ")" * depth
+    )
+
+
+def test_render_deeply_nested_blocks() -> None:
+    """Check that nesting blocks is not limited by the recursion limit."""
+    depth = sys.getrecursionlimit() * 2
+    content = [LsclBlock(name="a")]
+    for _ in range(depth):
+        content = [LsclBlock(name="a", content=content)]
+
+    assert render_as_lscl(content) == (
+        "".join(f"{'  ' * i}a {'{'}\n" for i in range(depth))
+        + "  " * depth
+        + "a {}\n"
+        + "".join(f"{'  ' * i}{'}'}\n" for i in reversed(range(depth)))
+    )
+
+
+def test_render_invalid_field_reference_escape_style() -> None:
+    """Check that unknown field reference escape styles are refused."""
+    with pytest.raises(ValueError, match=r"escape style"):
+        render_as_lscl(
+            LsclSelector(names=["a"]),
+            field_reference_escape_style="unknown",  # type: ignore
+        )
 
 
 def test_render_unknown_type() -> None:
     """Test rendering an unknown type."""
     with pytest.raises(TypeError):
         render_as_lscl(pytest)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    (
+        [LsclBlock(name="example"), 42],
+        [42, [pytest]],
+        {"key": {42: "value"}},
+        LsclEqualTo.model_construct(first=pytest, second=1),
+        [LsclBlock.model_construct(name="a", content=[42])],
+        [
+            LsclConditions.model_construct(
+                conditions=[(LsclSelector(names=["a"]), [42])],
+            ),
+        ],
+    ),
+)
+def test_render_unknown_nested_type(raw: LsclRenderable) -> None:
+    """Test rendering unknown types within lists or dictionaries."""
+    with pytest.raises(TypeError):
+        render_as_lscl(raw)
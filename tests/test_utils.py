@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# *****************************************************************************
+# Copyright (C) 2024 Thomas Touhey <thomas@touhey.fr>
+#
+# This software is governed by the CeCILL-C license under French law and
+# abiding by the rules of distribution of free software. You can use, modify
+# and/or redistribute the software under the terms of the CeCILL-C license
+# as circulated by CEA, CNRS and INRIA at the following
+# URL: https://cecill.info
+#
+# As a counterpart to the access to the source code and rights to copy, modify
+# and redistribute granted by the license, users are provided only with a
+# limited warranty and the software's author, the holder of the economic
+# rights, and the successive licensors have only limited liability.
+#
+# In this respect, the user's attention is drawn to the risks associated with
+# loading, using, modifying and/or developing or reproducing the software by
+# the user in light of its specific status of free software, that may mean
+# that it is complicated to manipulate, and that also therefore means that it
+# is reserved for developers and experienced professionals having in-depth
+# computer knowledge. Users are therefore encouraged to load and test the
+# software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and, more generally,
+# to use and operate it in the same conditions as regards security.
+#
+# The fact that you are presently reading this means that you have had
+# knowledge of the CeCILL-C license and that you accept its terms.
+# *****************************************************************************
+"""Tests for the ``lscl.utils`` module."""
+
+from __future__ import annotations
+
+import pytest
+
+from lscl.utils import Runk
+
+
+@pytest.mark.parametrize(
+    "raw,start,end,expected",
+    (
+        ("hello", 0, 5, Runk(line=3, column=9, offset=15)),
+        ("hello", 1, 3, Runk(line=3, column=6, offset=12)),
+        ("hello\nworld", 0, 11, Runk(line=4, column=6, offset=21)),
+        ("a\nb\n\ncd", 2, 7, Runk(line=5, column=3, offset=15)),
+        ("a\nb\n\ncd", 1, 2, Runk(line=4, column=1, offset=11)),
+        ("ab\ncd", 1, 1, Runk(line=3, column=4, offset=10)),
+    ),
+)
+def test_runk_count(raw: str, start: int, end: int, expected: Runk) -> None:
+    """Check that strings and ranges of strings are counted correctly."""
+    runk = Runk(line=3, column=4, offset=10)
+    runk.count_range(raw, start, end)
+    assert runk == expected
+
+    runk = Runk(line=3, column=4, offset=10)
+    runk.count(raw[start:end])
+    assert runk == expected